@@ -5,7 +5,7 @@ Classification endpoints for intent and job-related classification.
 from fastapi import APIRouter, Depends
 from app.schemas import UpworkRequest
 from app.services.llm_service import LLMService
-from app.core.constants import groq_client
+from app.core.providers import groq_client
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -24,7 +24,7 @@ def classify_input(req: UpworkRequest):
     Returns:
         JSON with is_job_related boolean
     """
-    llm_service = LLMService(groq_client)
+    llm_service = LLMService(groq_client.get())
     is_job_related = llm_service.classify_job_intent(req.requirement)
     
     return {"is_job_related": is_job_related}
@@ -3,21 +3,54 @@
 Debug and utility endpoints.
 """
 from fastapi import APIRouter, HTTPException
-from app.services.vectorstore_service import ProjectStoreService
+from app.database import pool_stats
+from app.services.vectorstore_service import (
+    ProjectStoreService,
+    ReviewStoreService,
+    ResumeStoreService,
+    query_embedding_cache,
+)
+from app.services.embedding_cache import embedding_cache
+from app.services.embedding_service import embedding_service
+from app.services.intent_cache import intent_cache
+from app.services.proposal_cache import proposal_cache
+from app.utils.extracted_text_cache import extracted_text_cache
+from app.core.exceptions import VectorStoreError
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/debug", tags=["debug"])
 
-# Global store instance (initialized on startup)
+# Global store instances (initialized on startup)
 project_store: ProjectStoreService = None
+review_store: ReviewStoreService = None
+resume_store: ResumeStoreService = None
 
 
-def set_store(store: ProjectStoreService) -> None:
-    """Set global store instance."""
-    global project_store
-    project_store = store
+def set_stores(
+    projects: ProjectStoreService,
+    reviews: ReviewStoreService,
+    resumes: ResumeStoreService,
+) -> None:
+    """Set global store instances."""
+    global project_store, review_store, resume_store
+    project_store = projects
+    review_store = reviews
+    resume_store = resumes
+
+
+def _get_store(name: str):
+    """Look up a store by name, raising 400 for unknown names."""
+    stores = {"projects": project_store, "reviews": review_store, "resumes": resume_store}
+    
+    if name not in stores:
+        raise HTTPException(
+            status_code=400,
+            detail="store must be 'projects', 'reviews' or 'resumes'"
+        )
+    
+    return stores[name]
 
 
 @router.post("/search")
@@ -49,3 +82,95 @@ def debug_search(payload: dict):
     except Exception as e:
         logger.error(f"Error in debug search: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/index-report")
+def index_report(payload: dict):
+    """
+    Recall-vs-latency report of FAISS index types against Flat search.
+    
+    Builds each candidate index from the stored embeddings; no model
+    inference is done.
+    
+    Args:
+        payload: JSON with optional store ("projects" or "reviews"),
+            index_types, sample_size, and top_k
+        
+    Returns:
+        JSON with recall and latency per index type
+    """
+    store = _get_store(payload.get("store", "projects"))
+    
+    try:
+        return store.index_report(
+            index_types=payload.get("index_types"),
+            sample_size=payload.get("sample_size", 200),
+            top_k=payload.get("top_k", 10),
+        )
+    except (VectorStoreError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error building index report: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/snapshots/{store_name}")
+def list_snapshots(store_name: str):
+    """
+    List persisted snapshot versions of a store.
+    
+    Args:
+        store_name: "projects", "reviews" or "resumes"
+        
+    Returns:
+        JSON with loaded version, manifest, and versions on disk
+    """
+    return _get_store(store_name).snapshot_info()
+
+
+@router.post("/snapshots/{store_name}/rollback")
+def rollback_snapshot(store_name: str, payload: dict):
+    """
+    Roll a store back to an earlier snapshot version.
+    
+    Args:
+        store_name: "projects", "reviews" or "resumes"
+        payload: JSON with version
+        
+    Returns:
+        JSON with the restored version
+    """
+    store = _get_store(store_name)
+    version = payload.get("version")
+    
+    if not isinstance(version, int):
+        raise HTTPException(status_code=400, detail="version is required")
+    
+    try:
+        store.rollback(version)
+    except VectorStoreError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    logger.info(f"Rolled back {store_name} store to version {version}")
+    
+    return {"status": "rolled_back", "version": store.version}
+
+
+@router.get("/stats")
+def debug_stats():
+    """
+    Runtime cache statistics.
+    
+    Returns:
+        JSON with hit/miss counters per cache, embedding batching stats,
+        and database connection pool usage
+    """
+    return {
+        "query_embedding_cache": query_embedding_cache.stats(),
+        "embedding_service": embedding_service.stats(),
+        "embedding_cache": embedding_cache.stats(),
+        "proposal_cache": proposal_cache.stats(),
+        "intent_cache": intent_cache.stats(),
+        "extracted_text_cache": extracted_text_cache.stats(),
+        "db_pool": pool_stats(),
+    }
@@ -3,35 +3,53 @@
 Proposal generation endpoints.
 """
 import json
+from typing import AsyncIterator, Optional, Tuple
+
+import numpy as np
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
-from app.database import SessionLocal
+from app.database import session_scope
 from app.models import ApplicationSession
 from app.schemas import UpworkRequest, FollowupRequest
 from app.services.llm_service import LLMService
+from app.services.proposal_cache import proposal_cache
 from app.services.vectorstore_service import (
     ProjectStoreService,
     ReviewStoreService,
     ResumeStoreService,
 )
-from app.core.constants import groq_client, RESUME_SIMILARITY_THRESHOLD
+from app.services.retrieval_service import RetrievalService
+from app.core.constants import RESUME_SIMILARITY_THRESHOLD
+from app.core.providers import groq_client, async_groq_client
 from app.core.exceptions import (
+    FileProcessingError,
     ResumeNotFoundError,
     ResumeSimilarityError,
     InvalidSessionError,
 )
-from app.utils.file_handler import extract_text_from_file
+from app.utils.file_handler import extract_upload_text
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/generate/upwork", tags=["proposals"])
 
+NOT_JOB_RELATED_ANSWER = (
+    "I am a job-application assistant and can only assist with "
+    "job-related queries such as proposals, requirements, resume "
+    "details, or hiring discussions."
+)
+
+# Disable proxy buffering so tokens reach the client as they are produced
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
 # Global store instances (initialized on startup)
 project_store: ProjectStoreService = None
 review_store: ReviewStoreService = None
 resume_store: ResumeStoreService = None
+retrieval_service: RetrievalService = None
 
 
 def set_stores(
@@ -40,64 +58,49 @@ def set_stores(
     resumes: ResumeStoreService,
 ) -> None:
     """Set global store instances."""
-    global project_store, review_store, resume_store
+    global project_store, review_store, resume_store, retrieval_service
     project_store = projects
     review_store = reviews
     resume_store = resumes
+    retrieval_service = RetrievalService(projects, reviews, resumes)
 
 
-@router.post("")
-def generate_upwork_proposal(req: UpworkRequest):
+def _save_new_session(requirement: str, resume_text: str, proposal: str) -> str:
     """
-    Generate Upwork proposal for a job requirement.
+    Persist a new application session.
+    
+    Runs in the threadpool from async endpoints; the DB session is only
+    held for the duration of the write.
     
     Args:
-        req: Proposal request with requirement and optional resume_name
+        requirement: Job requirement
+        resume_text: Resume text used for the proposal
+        proposal: Generated proposal
         
     Returns:
-        JSON with session_id and generated proposal
+        ID of the created session
     """
-    try:
-        db: Session = SessionLocal()
-        llm_service = LLMService(groq_client)
-        
-        # Search for relevant projects and reviews
-        projects_text = project_store.search(req.requirement)
-        logger.info(f"Project search results:\n{projects_text}\n---")
-        
-        review_text = review_store.search(req.requirement)
-        logger.info(f"Review search results:\n{review_text}\n---")
-        
-        # Get resume
-        if req.resume_name:
-            resume_data = resume_store.get_by_name(req.resume_name)
-            logger.info(f"Resume search result for '{req.resume_name}':\n{resume_data}\n---")
-            
-            if not resume_data:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Resume with name '{req.resume_name}' not found."
-                )
-        else:
-            resume_data = resume_store.search(req.requirement)
-            logger.info(f"Resume search result for semantic search:\n{resume_data}\n---")
-            
-            similarity_score = resume_data.get("score", 0)
-            
-            # Check threshold
-            if similarity_score < RESUME_SIMILARITY_THRESHOLD:
-                return {
-                    "error": "Requirements do not match with your resume list. "
-                             "Do you want to proceed with the most similar resume "
-                             "or do you want to upload a new one?",
-                    "best_match_resume": resume_data["metadata"]["name"],
-                    "similarity_score": similarity_score
-                }
-        
-        resume_text = resume_data["text"]
-        logger.info(f"Using resume text:\n{resume_text}\n---")
+    conversation = [
+        {"role": "user", "content": requirement},
+        {"role": "assistant", "content": proposal}
+    ]
+    
+    with session_scope() as db:
+        session_obj = ApplicationSession(
+            requirement=requirement,
+            resume_text=resume_text,
+            proposal_text=proposal,
+            conversation_json=json.dumps(conversation)
+        )
         
-        combined_text = f"""
+        db.add(session_obj)
+        db.flush()
+        return session_obj.id
+
+
+def _combined_text(resume_text: str, projects_text: str, review_text: str) -> str:
+    """Build the context block passed to the proposal prompt."""
+    return f"""
 Candidate Resume:
 {resume_text}
 
@@ -107,38 +110,221 @@ Structured Project Data:
 Client Feedback Data:
 {review_text}
 """
+
+
+def _load_session(session_id: str) -> Optional[dict]:
+    """
+    Read an application session for a streaming follow-up.
+    
+    Args:
+        session_id: Session ID
         
-        # Generate proposal
-        proposal = llm_service.generate_proposal(
-            requirement=req.requirement,
-            projects_text=combined_text
-        )
-        logger.info(f"Generated proposal:\n{proposal}\n---")
+    Returns:
+        Dict with requirement, resume_text, proposal_text and conversation,
+        or None if the session does not exist
+    """
+    with session_scope() as db:
+        session_obj = db.query(ApplicationSession).filter_by(id=session_id).first()
+        if not session_obj:
+            return None
         
-        # Create conversation history
-        conversation = [
-            {"role": "user", "content": req.requirement},
-            {"role": "assistant", "content": proposal}
-        ]
+        return {
+            "requirement": session_obj.requirement,
+            "resume_text": session_obj.resume_text,
+            "proposal_text": session_obj.proposal_text,
+            "conversation": json.loads(session_obj.conversation_json),
+        }
+
+
+def _update_session(
+    session_id: str,
+    conversation: list,
+    requirement: Optional[str] = None,
+    proposal: Optional[str] = None,
+) -> None:
+    """
+    Persist a follow-up turn, and the new requirement/proposal if one was generated.
+    
+    Args:
+        session_id: Session ID
+        conversation: Full conversation history
+        requirement: New job requirement, if any
+        proposal: New proposal, if any
+    """
+    with session_scope() as db:
+        session_obj = db.query(ApplicationSession).filter_by(id=session_id).first()
+        if not session_obj:
+            raise InvalidSessionError(f"Invalid session_id: {session_id}")
         
-        # Save session to database
-        session_obj = ApplicationSession(
-            requirement=req.requirement,
-            resume_text=resume_text,
-            proposal_text=proposal,
-            conversation_json=json.dumps(conversation)
+        if requirement is not None:
+            session_obj.requirement = requirement
+        if proposal is not None:
+            session_obj.proposal_text = proposal
+        session_obj.conversation_json = json.dumps(conversation)
+
+
+def _context_versions() -> Tuple[Optional[int], ...]:
+    """Snapshot versions of the project and review stores, for proposal cache keys."""
+    return (project_store.version, review_store.version)
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _proposal_context(req: UpworkRequest) -> dict:
+    """
+    Retrieve projects, reviews and the resume for a proposal request.
+    
+    Args:
+        req: Proposal request with requirement and optional resume_name
+        
+    Returns:
+        Dict with resume_text, combined_text, query_embedding and
+        context_versions, or the resume mismatch response (with an "error" key) if no resume is
+        similar enough
+        
+    Raises:
+        HTTPException: If the named resume does not exist
+    """
+    # Taken before retrieval, so a concurrent sync can only make the
+    # cache key older than the context, never newer
+    context_versions = _context_versions()
+    
+    # Search projects, reviews and (if no resume named) resumes in one pass
+    retrieved = await retrieval_service.retrieve_async(
+        req.requirement,
+        include_resume=not req.resume_name,
+    )
+    
+    projects_text = retrieved["projects_text"]
+    logger.info(f"Project search results:\n{projects_text}\n---")
+    
+    review_text = retrieved["review_text"]
+    logger.info(f"Review search results:\n{review_text}\n---")
+    
+    # Get resume
+    if req.resume_name:
+        resume_data = resume_store.get_by_name(req.resume_name)
+        logger.info(f"Resume search result for '{req.resume_name}':\n{resume_data}\n---")
+        
+        if not resume_data:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Resume with name '{req.resume_name}' not found."
+            )
+    else:
+        resume_data = retrieved["resume"]
+        logger.info(f"Resume search result for semantic search:\n{resume_data}\n---")
+        
+        similarity_score = resume_data.get("score", 0)
+        
+        # Check threshold
+        if similarity_score < RESUME_SIMILARITY_THRESHOLD:
+            return {
+                "error": "Requirements do not match with your resume list. "
+                         "Do you want to proceed with the most similar resume "
+                         "or do you want to upload a new one?",
+                "best_match_resume": resume_data["metadata"]["name"],
+                "similarity_score": similarity_score
+            }
+    
+    resume_text = resume_data["text"]
+    logger.info(f"Using resume text:\n{resume_text}\n---")
+    
+    return {
+        "resume_text": resume_text,
+        "combined_text": _combined_text(resume_text, projects_text, review_text),
+        "query_embedding": retrieved["query_embedding"],
+        "context_versions": context_versions,
+    }
+
+
+def _total_tokens(usage) -> int:
+    """Total tokens from a Groq usage report (0 if not reported)."""
+    return getattr(usage, "total_tokens", 0) or 0
+
+
+async def _generate_proposal(
+    llm_service: LLMService,
+    requirement: str,
+    resume_text: str,
+    combined_text: str,
+    query_emb: np.ndarray,
+    context_versions: Tuple[Optional[int], ...],
+) -> Tuple[str, bool]:
+    """
+    Generate a proposal, reusing a cached one for a near-identical requirement.
+    
+    Args:
+        llm_service: LLM service
+        requirement: Job requirement
+        resume_text: Resume text used for the proposal
+        combined_text: Resume, project and review context
+        query_emb: Requirement embedding from retrieval
+        context_versions: Store versions the context was retrieved from
+        
+    Returns:
+        (proposal, whether it came from the cache unchanged)
+    """
+    match = proposal_cache.lookup(resume_text, query_emb, context_versions)
+    if match and match.kind == "hit":
+        return match.proposal, True
+    
+    proposal = await llm_service.generate_proposal_async(
+        requirement=requirement,
+        projects_text=combined_text,
+        draft=match.proposal if match else None
+    )
+    proposal_cache.store(
+        resume_text, query_emb, proposal, _total_tokens(llm_service.last_usage), context_versions
+    )
+    return proposal, False
+
+
+@router.post("")
+async def generate_upwork_proposal(req: UpworkRequest):
+    """
+    Generate Upwork proposal for a job requirement.
+    
+    Args:
+        req: Proposal request with requirement and optional resume_name
+        
+    Returns:
+        JSON with session_id and generated proposal
+    """
+    try:
+        llm_service = LLMService(groq_client.get(), async_groq_client.get())
+        
+        context = await _proposal_context(req)
+        if "error" in context:
+            return context
+        
+        resume_text = context["resume_text"]
+        
+        # Generate proposal (or reuse one for a near-identical requirement)
+        proposal, cached = await _generate_proposal(
+            llm_service,
+            req.requirement,
+            resume_text,
+            context["combined_text"],
+            context["query_embedding"],
+            context["context_versions"],
         )
+        logger.info(f"Generated proposal (cached={cached}):\n{proposal}\n---")
         
-        db.add(session_obj)
-        db.commit()
-        db.refresh(session_obj)
-        db.close()
+        # Save session to database
+        session_id = await run_in_threadpool(
+            _save_new_session, req.requirement, resume_text, proposal
+        )
         
-        logger.info(f"Created session: {session_obj.id}")
+        logger.info(f"Created session: {session_id}")
         
         return {
-            "session_id": session_obj.id,
-            "proposal": proposal
+            "session_id": session_id,
+            "proposal": proposal,
+            "cached": cached
         }
         
     except HTTPException:
@@ -160,23 +346,22 @@ def generate_followup(req: FollowupRequest):
         JSON with answer or new proposal (if new job requirement detected)
     """
     try:
-        db: Session = SessionLocal()
-        llm_service = LLMService(groq_client)
+        llm_service = LLMService(groq_client.get())
         
-        # Get session
-        session_obj = db.query(ApplicationSession).filter_by(id=req.session_id).first()
-        logger.info(f"Retrieved session for ID {req.session_id}: {session_obj}")
+        # Get session; no connection is held during the LLM calls below
+        session_data = _load_session(req.session_id)
+        logger.info(f"Retrieved session for ID {req.session_id}: {session_data is not None}")
         
-        if not session_obj:
+        if not session_data:
             raise HTTPException(status_code=404, detail="Invalid session_id")
         
-        conversation = json.loads(session_obj.conversation_json)
+        conversation = session_data["conversation"]
         logger.info(f"Current conversation history:\n{conversation}\n---")
         
         # Classify intent
         intent = llm_service.classify_conversation_intent(
-            requirement=session_obj.requirement,
-            proposal=session_obj.proposal_text,
+            requirement=session_data["requirement"],
+            proposal=session_data["proposal_text"],
             conversation=conversation[-4:],  # Keep context short
             new_input=req.question
         )
@@ -185,19 +370,11 @@ def generate_followup(req: FollowupRequest):
         
         # CASE 1: New Job Requirement
         if intent == "NEW_JOB_REQUIREMENT":
-            projects_text = project_store.search(req.question)
-            review_text = review_store.search(req.question)
+            retrieved = retrieval_service.retrieve(req.question, include_resume=False)
+            projects_text = retrieved["projects_text"]
+            review_text = retrieved["review_text"]
             
-            combined_text = f"""
-Candidate Resume:
-{session_obj.resume_text}
-
-Structured Project Data:
-{projects_text}
-
-Client Feedback Data:
-{review_text}
-"""
+            combined_text = _combined_text(session_data["resume_text"], projects_text, review_text)
             
             proposal = llm_service.generate_proposal(
                 requirement=req.question,
@@ -208,10 +385,10 @@ Client Feedback Data:
             conversation.append({"role": "user", "content": req.question})
             conversation.append({"role": "assistant", "content": proposal})
             
-            session_obj.requirement = req.question
-            session_obj.proposal_text = proposal
-            session_obj.conversation_json = json.dumps(conversation)
-            db.commit()
+            _update_session(
+                req.session_id, conversation,
+                requirement=req.question, proposal=proposal
+            )
             
             logger.info("Regenerated proposal for new job requirement")
             
@@ -220,9 +397,9 @@ Client Feedback Data:
         # CASE 2: Follow-up Question
         elif intent == "FOLLOWUP_QUESTION":
             answer = llm_service.generate_followup_answer(
-                requirement=session_obj.requirement,
-                resume_text=session_obj.resume_text,
-                proposal_text=session_obj.proposal_text,
+                requirement=session_data["requirement"],
+                resume_text=session_data["resume_text"],
+                proposal_text=session_data["proposal_text"],
                 conversation=conversation,
                 question=req.question
             )
@@ -230,8 +407,7 @@ Client Feedback Data:
             conversation.append({"role": "user", "content": req.question})
             conversation.append({"role": "assistant", "content": answer})
             
-            session_obj.conversation_json = json.dumps(conversation)
-            db.commit()
+            _update_session(req.session_id, conversation)
             
             logger.info("Generated follow-up answer")
             
@@ -239,19 +415,202 @@ Client Feedback Data:
         
         # CASE 3: Not Job Related
         else:
-            return {
-                "answer": "I am a job-application assistant and can only assist with "
-                          "job-related queries such as proposals, requirements, resume "
-                          "details, or hiring discussions."
-            }
+            return {"answer": NOT_JOB_RELATED_ANSWER}
         
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error generating follow-up: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        db.close()
+
+
+@router.post("/stream")
+async def stream_upwork_proposal(req: UpworkRequest):
+    """
+    Generate Upwork proposal, streaming tokens as Server-Sent Events.
+    
+    Retrieval and resume checks run before the stream opens, so a missing
+    resume is a 404 and a resume mismatch returns the same JSON as the
+    non-streaming endpoint. Otherwise the response is text/event-stream:
+    "token" events carry {"text": ...}, and a final "done" event carries
+    {"session_id": ..., "proposal": ..., "cached": ...} once the session is
+    saved, or an "error" event carries {"detail": ...}. A cached proposal
+    arrives as a single token event.
+    
+    Args:
+        req: Proposal request with requirement and optional resume_name
+        
+    Returns:
+        StreamingResponse of proposal events, or resume mismatch JSON
+    """
+    try:
+        llm_service = LLMService(groq_client.get(), async_groq_client.get())
+        context = await _proposal_context(req)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error preparing proposal stream: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if "error" in context:
+        return context
+    
+    async def events() -> AsyncIterator[str]:
+        resume_text = context["resume_text"]
+        query_emb = context["query_embedding"]
+        context_versions = context["context_versions"]
+        parts = []
+        try:
+            match = proposal_cache.lookup(resume_text, query_emb, context_versions)
+            cached = bool(match and match.kind == "hit")
+            
+            if cached:
+                yield _sse("token", {"text": match.proposal})
+                proposal = match.proposal
+            else:
+                async for delta in llm_service.stream_proposal(
+                    requirement=req.requirement,
+                    projects_text=context["combined_text"],
+                    draft=match.proposal if match else None
+                ):
+                    parts.append(delta)
+                    yield _sse("token", {"text": delta})
+                
+                proposal = "".join(parts).strip()
+                proposal_cache.store(
+                    resume_text,
+                    query_emb,
+                    proposal,
+                    _total_tokens(llm_service.last_usage),
+                    context_versions,
+                )
+            
+            logger.info(f"Generated proposal (cached={cached}):\n{proposal}\n---")
+            
+            # Save session once the full proposal is known
+            session_id = await run_in_threadpool(
+                _save_new_session, req.requirement, resume_text, proposal
+            )
+            
+            logger.info(f"Created session: {session_id}")
+            
+            yield _sse("done", {"session_id": session_id, "proposal": proposal, "cached": cached})
+            
+        except Exception as e:
+            logger.error(f"Error streaming proposal: {str(e)}")
+            yield _sse("error", {"detail": str(e)})
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.post("/followup/stream")
+async def stream_followup(req: FollowupRequest):
+    """
+    Answer a follow-up question, streaming tokens as Server-Sent Events.
+    
+    Intent is classified before the stream opens. Events are as for
+    /stream; the "done" event carries {"answer": ...} for a follow-up
+    question, or {"proposal": ...} if a new job requirement was detected.
+    The session is updated once the stream finishes.
+    
+    Args:
+        req: Follow-up request with session_id and question
+        
+    Returns:
+        StreamingResponse of answer or proposal events
+    """
+    try:
+        llm_service = LLMService(groq_client.get(), async_groq_client.get())
+        
+        session_data = await run_in_threadpool(_load_session, req.session_id)
+        logger.info(f"Retrieved session for ID {req.session_id}: {session_data is not None}")
+        
+        if not session_data:
+            raise HTTPException(status_code=404, detail="Invalid session_id")
+        
+        conversation = session_data["conversation"]
+        
+        # Classify intent
+        intent = await run_in_threadpool(
+            llm_service.classify_conversation_intent,
+            requirement=session_data["requirement"],
+            proposal=session_data["proposal_text"],
+            conversation=conversation[-4:],  # Keep context short
+            new_input=req.question
+        )
+        
+        logger.info(f"Detected intent: {intent}")
+        
+        # CASE 1: New Job Requirement
+        if intent == "NEW_JOB_REQUIREMENT":
+            retrieved = await retrieval_service.retrieve_async(req.question, include_resume=False)
+            tokens = llm_service.stream_proposal(
+                requirement=req.question,
+                projects_text=_combined_text(
+                    session_data["resume_text"],
+                    retrieved["projects_text"],
+                    retrieved["review_text"],
+                )
+            )
+            result_key = "proposal"
+        
+        # CASE 2: Follow-up Question
+        elif intent == "FOLLOWUP_QUESTION":
+            tokens = llm_service.stream_followup_answer(
+                requirement=session_data["requirement"],
+                resume_text=session_data["resume_text"],
+                proposal_text=session_data["proposal_text"],
+                conversation=conversation,
+                question=req.question
+            )
+            result_key = "answer"
+        
+        # CASE 3: Not Job Related
+        else:
+            tokens = None
+            result_key = "answer"
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error preparing follow-up stream: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    async def events() -> AsyncIterator[str]:
+        if tokens is None:
+            yield _sse("token", {"text": NOT_JOB_RELATED_ANSWER})
+            yield _sse("done", {"answer": NOT_JOB_RELATED_ANSWER})
+            return
+        
+        parts = []
+        try:
+            async for delta in tokens:
+                parts.append(delta)
+                yield _sse("token", {"text": delta})
+            
+            content = "".join(parts).strip()
+            
+            conversation.append({"role": "user", "content": req.question})
+            conversation.append({"role": "assistant", "content": content})
+            
+            if result_key == "proposal":
+                # Reset conversation to the new requirement
+                await run_in_threadpool(
+                    _update_session, req.session_id, conversation,
+                    requirement=req.question, proposal=content
+                )
+                logger.info("Regenerated proposal for new job requirement")
+            else:
+                await run_in_threadpool(_update_session, req.session_id, conversation)
+                logger.info("Generated follow-up answer")
+            
+            yield _sse("done", {result_key: content})
+            
+        except Exception as e:
+            logger.error(f"Error streaming follow-up: {str(e)}")
+            yield _sse("error", {"detail": str(e)})
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 @router.post("/upload")
@@ -267,7 +626,8 @@ async def generate_with_upload(
         file: Resume file (PDF or TXT)
         
     Returns:
-        JSON with session_id and generated proposal
+        JSON with session_id, generated proposal, and cache_hit (whether
+        the resume text was reused from an identical earlier upload)
     """
     if not file:
         raise HTTPException(
@@ -276,15 +636,16 @@ async def generate_with_upload(
         )
     
     try:
-        db: Session = SessionLocal()
-        llm_service = LLMService(groq_client)
+        llm_service = LLMService(groq_client.get(), async_groq_client.get())
         
         # Extract resume text
-        resume_text = await extract_text_from_file(file)
+        resume_text, cache_hit = await extract_upload_text(file)
         
         # Search for projects and reviews
-        projects_text = project_store.search(requirement)
-        review_text = review_store.search(requirement)
+        context_versions = _context_versions()
+        retrieved = await retrieval_service.retrieve_async(requirement, include_resume=False)
+        projects_text = retrieved["projects_text"]
+        review_text = retrieved["review_text"]
         
         combined_text = f"""
 Candidate Resume:
@@ -297,38 +658,33 @@ Client Feedback:
 {review_text}
 """
         
-        # Generate proposal
-        proposal = llm_service.generate_proposal(
-            requirement=requirement,
-            projects_text=combined_text
+        # Generate proposal (or reuse one for a near-identical requirement)
+        proposal, cached = await _generate_proposal(
+            llm_service,
+            requirement,
+            resume_text,
+            combined_text,
+            retrieved["query_embedding"],
+            context_versions,
         )
         
-        # Create conversation history
-        conversation = [
-            {"role": "user", "content": requirement},
-            {"role": "assistant", "content": proposal}
-        ]
-        
         # Save session
-        session_obj = ApplicationSession(
-            requirement=requirement,
-            resume_text=resume_text,
-            proposal_text=proposal,
-            conversation_json=json.dumps(conversation)
+        session_id = await run_in_threadpool(
+            _save_new_session, requirement, resume_text, proposal
         )
         
-        db.add(session_obj)
-        db.commit()
-        db.refresh(session_obj)
-        db.close()
-        
-        logger.info(f"Created session with uploaded resume: {session_obj.id}")
+        logger.info(f"Created session with uploaded resume: {session_id}")
         
         return {
-            "session_id": session_obj.id,
-            "proposal": proposal
+            "session_id": session_id,
+            "proposal": proposal,
+            "cached": cached,
+            "cache_hit": cache_hit
         }
         
+    except FileProcessingError as e:
+        logger.error(f"File processing error: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error generating proposal from upload: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
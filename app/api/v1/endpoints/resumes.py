@@ -3,8 +3,9 @@
 Resume management endpoints.
 """
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from app.services.vectorstore_service import ResumeStoreService
-from app.utils.file_handler import extract_text_from_file
+from app.utils.file_handler import extract_upload_text
 from app.core.exceptions import ResumeNotFoundError, FileProcessingError
 from app.core.logging import get_logger
 
@@ -52,20 +53,22 @@ async def upload_resume(
         file: Resume file (PDF or TXT)
         
     Returns:
-        JSON with success status
+        JSON with success status and cache_hit (whether the text was
+        reused from an identical earlier upload)
     """
     try:
         # Extract text from file
-        resume_text = await extract_text_from_file(file)
+        resume_text, cache_hit = await extract_upload_text(file)
         
-        # Add to store
-        resume_store.add_resume(resume_name, resume_text)
+        # Add to store (embeds, takes the snapshot file lock and fsyncs)
+        await run_in_threadpool(resume_store.add_resume, resume_name, resume_text)
         
         logger.info(f"Successfully uploaded resume: {resume_name}")
         
         return {
             "status": "success",
-            "resume_name": resume_name
+            "resume_name": resume_name,
+            "cache_hit": cache_hit
         }
         
     except ResumeNotFoundError as e:
@@ -2,7 +2,6 @@
 """
 Data synchronization endpoints for Google Sheets.
 """
-import pandas as pd
 from fastapi import APIRouter, HTTPException
 
 from app.services.vectorstore_service import (
@@ -54,66 +53,24 @@ def sync_projects_from_google_sheet(payload: dict):
         df = load_google_sheet_dataframe(sheet_url)
         logger.info(f"PROJECT CSV HEADERS: {df.columns.tolist()}")
         
-        # Reset store
-        project_store.index = None
-        project_store.texts = []
-        project_store.metadata = []
-        
-        # Process rows
-        for _, row in df.iterrows():
-            project_name = str(row.get("PROJECT NAME", "")).strip()
-            project_type = str(row.get("", "")).strip()
-            
-            if not project_type:
-                project_type = str(row.get("Unnamed: 1", "")).strip()
-            
-            industry = str(row.get("INDUSTRY", "")).strip()
-            tech_stack = str(row.get("Tech Stack", "")).strip()
-            description = str(row.get("DESCRIPTION", "")).strip()
-            
-            # Skip empty rows
-            if not (project_name or industry or tech_stack or description):
-                continue
-            
-            text = f"""
-Project: {project_name}
-Project Type: {project_type}
-Industry: {industry}
-Tech Stack: {tech_stack}
-Description: {description}
-""".strip()
-            
-            project_store.texts.append(text)
-            project_store.metadata.append({
-                "project_name": project_name,
-                "project_type": project_type,
-                "industry": industry,
-            })
+        texts, metadata = project_store.rows_from_sheet(df)
         
         # Check if we have data
-        if not project_store.texts:
+        if not texts:
             raise HTTPException(
                 status_code=400,
                 detail="No valid rows found in projects sheet. Check headers/rows."
             )
         
-        # Build and save index
-        embeddings = project_store.model.encode(
-            project_store.texts,
-            normalize_embeddings=True,
-        ).astype("float32")
-        
-        project_store._build_index(embeddings)
-        project_store.save()
-        
-        # Reload to ensure RAM matches disk
-        project_store.load()
+        # Diff against the current store; only new/changed rows are embedded
+        counts = project_store.sync_rows(texts, metadata)
         
         logger.info(f"Successfully synced {len(project_store.texts)} projects")
         
         return {
             "status": "success",
-            "rows": len(project_store.texts)
+            "rows": len(project_store.texts),
+            **counts,
         }
         
     except InvalidGoogleSheetError as e:
@@ -147,26 +104,10 @@ def sync_reviews_from_google_sheet(payload: dict):
         # Load sheet
         df = load_google_sheet_dataframe(sheet_url)
         
-        # Reset store
-        review_store.index = None
-        review_store.texts = []
-        review_store.metadata = []
-        
-        # Process rows
-        for _, row in df.iterrows():
-            text = review_store._row_to_text(row)
-            if not text.strip():
-                continue
-            
-            review_store.texts.append(text)
-            review_store.metadata.append({
-                "product": str(row.get("Product Name", "")).strip(),
-                "rating": row.get("Rating"),
-                "country": str(row.get("Country", "")).strip(),
-            })
+        texts, metadata = review_store.rows_from_dataframe(df)
         
         # Check if we have data
-        if not review_store.texts:
+        if not texts:
             logger.warning("No review rows found in sheet")
             return {
                 "status": "success",
@@ -174,23 +115,15 @@ def sync_reviews_from_google_sheet(payload: dict):
                 "message": "No review rows found."
             }
         
-        # Build and save index
-        embeddings = review_store.model.encode(
-            review_store.texts,
-            normalize_embeddings=True,
-        ).astype("float32")
-        
-        review_store._build_index(embeddings)
-        review_store.save()
-        
-        # Reload
-        review_store.load()
+        # Diff against the current store; only new/changed rows are embedded
+        counts = review_store.sync_rows(texts, metadata)
         
         logger.info(f"Successfully synced {len(review_store.texts)} reviews")
         
         return {
             "status": "success",
-            "rows": len(review_store.texts)
+            "rows": len(review_store.texts),
+            **counts,
         }
         
     except InvalidGoogleSheetError as e:
@@ -0,0 +1,93 @@
+# app/core/embedding_backends.py
+"""
+Embedding model backends.
+
+"torch" runs SentenceTransformer on PyTorch. "onnx" runs the same model
+on ONNX Runtime, and "onnx-int8" runs it with dynamic int8 quantization.
+The ONNX backends need `pip install sentence-transformers[onnx]`.
+Quantized exports are cached under EMBED_ONNX_DIR, so only the first
+load pays for the export.
+"""
+import importlib.util
+from pathlib import Path
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+EMBED_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+# Installed by the sentence-transformers[onnx] extra
+ONNX_REQUIREMENTS = ("onnxruntime", "optimum")
+
+
+def _check_onnx_installed(backend: str) -> None:
+    """Fail early with the install command if the ONNX extra is missing."""
+    missing = [name for name in ONNX_REQUIREMENTS if importlib.util.find_spec(name) is None]
+    if missing:
+        raise ImportError(
+            f"Embedding backend '{backend}' requires {', '.join(missing)}. "
+            "Install it with: pip install 'sentence-transformers[onnx]'"
+        )
+
+
+def load_embedding_model(
+    model_name: str,
+    backend: str,
+    onnx_dir: str,
+    quantization: str = "avx2",
+):
+    """
+    Load a SentenceTransformer model on the given backend.
+
+    Args:
+        model_name: Hugging Face model name
+        backend: One of EMBED_BACKENDS
+        onnx_dir: Directory caching the exported ONNX model
+        quantization: Optimum quantization config for onnx-int8
+            ("arm64", "avx2", "avx512", "avx512_vnni")
+
+    Returns:
+        SentenceTransformer model instance
+
+    Raises:
+        ValueError: If backend is unknown
+        ImportError: If an ONNX backend is requested without the onnx extra
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if backend not in EMBED_BACKENDS:
+        raise ValueError(
+            f"Unknown embedding backend '{backend}'. Expected one of {EMBED_BACKENDS}."
+        )
+
+    if backend == "torch":
+        return SentenceTransformer(model_name)
+
+    _check_onnx_installed(backend)
+
+    if backend == "onnx":
+        # Uses the hub's onnx/model.onnx, exporting it if the repo has none
+        return SentenceTransformer(model_name, backend="onnx")
+
+    file_name = f"onnx/model_qint8_{quantization}.onnx"
+    local_dir = Path(onnx_dir)
+
+    if not (local_dir / file_name).exists():
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        logger.info(f"Exporting int8 ({quantization}) ONNX model to {local_dir}...")
+        model = SentenceTransformer(model_name, backend="onnx")
+        model.save_pretrained(str(local_dir))
+        export_dynamic_quantized_onnx_model(
+            model,
+            quantization,
+            str(local_dir),
+            file_suffix=f"qint8_{quantization}",
+        )
+
+    return SentenceTransformer(
+        str(local_dir),
+        backend="onnx",
+        model_kwargs={"file_name": file_name},
+    )
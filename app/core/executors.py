@@ -0,0 +1,255 @@
+# app/core/executors.py
+"""
+Dedicated executors for CPU-bound work (FAISS search, embedding).
+
+FAISS and PyTorch release the GIL inside their native kernels, so a small
+thread pool gives real parallelism without tying up the Starlette
+threadpool that serves sync endpoints. Pure-Python work that holds the
+GIL (PDF parsing) runs in a separate, bounded process pool instead.
+Process pool workers record which task they are running and since when,
+so a time limit can be measured from the moment a task starts rather
+than from when it was queued.
+"""
+import asyncio
+import functools
+import itertools
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.core.constants import CPU_EXECUTOR_WORKERS, PROCESS_POOL_WORKERS
+
+T = TypeVar("T")
+
+_cpu_executor: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+_task_tracker: Optional["_TaskTracker"] = None
+_task_ids = itertools.count(1)
+_lock = threading.Lock()
+
+# How often a caller checks whether its running task has overrun
+_DEADLINE_POLL_SECONDS = 0.25
+
+# Set in each pool worker by _init_worker
+_worker_tracker: Optional["_TaskTracker"] = None
+_worker_slot = 0
+
+
+class _TaskTracker:
+    """Shared memory where each pool worker records its current task."""
+
+    def __init__(self, context: Any, workers: int):
+        self.task_ids = context.RawArray("q", workers)
+        self.started_at = context.RawArray("d", workers)
+        self.next_slot = context.Value("i", 0)
+
+    def started(self, task_id: int) -> Optional[float]:
+        """Wall-clock start of a task, or None if no worker is running it."""
+        for slot, running_id in enumerate(self.task_ids):
+            if running_id == task_id:
+                # started_at is written before the task ID, so it matches
+                return self.started_at[slot]
+        return None
+
+
+def _init_worker(tracker: _TaskTracker) -> None:
+    """Claim a tracker slot for this worker process."""
+    global _worker_tracker, _worker_slot
+    with tracker.next_slot.get_lock():
+        _worker_slot = tracker.next_slot.value
+        tracker.next_slot.value += 1
+    _worker_tracker = tracker
+
+
+def _run_tracked(task_id: int, func: Callable[..., T], args: Tuple, kwargs: Dict[str, Any]) -> T:
+    """Run a task in a worker, recording it as running while it runs."""
+    _worker_tracker.started_at[_worker_slot] = time.time()
+    _worker_tracker.task_ids[_worker_slot] = task_id
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _worker_tracker.task_ids[_worker_slot] = 0
+
+
+def get_cpu_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared CPU-bound executor, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor sized by CPU_EXECUTOR_WORKERS
+    """
+    global _cpu_executor
+    if _cpu_executor is None:
+        with _lock:
+            if _cpu_executor is None:
+                _cpu_executor = ThreadPoolExecutor(
+                    max_workers=CPU_EXECUTOR_WORKERS,
+                    thread_name_prefix="cpu-bound",
+                )
+    return _cpu_executor
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a CPU-bound callable on the dedicated executor.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_cpu_executor(),
+        functools.partial(func, *args, **kwargs),
+    )
+
+
+def shutdown_cpu_executor() -> None:
+    """Shut down the CPU-bound executor if it was started."""
+    global _cpu_executor
+    with _lock:
+        if _cpu_executor is not None:
+            _cpu_executor.shutdown(wait=False, cancel_futures=True)
+            _cpu_executor = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool, creating it on first use.
+
+    Workers are spawned rather than forked: the parent runs model and
+    watcher threads that fork would copy mid-operation.
+
+    Returns:
+        ProcessPoolExecutor sized by PROCESS_POOL_WORKERS
+    """
+    return _current_pool()[0]
+
+
+def _current_pool() -> Tuple[ProcessPoolExecutor, _TaskTracker]:
+    """Get the shared process pool and its task tracker, creating them on first use."""
+    global _process_pool, _task_tracker
+    with _lock:
+        if _process_pool is None:
+            context = multiprocessing.get_context("spawn")
+            _task_tracker = _TaskTracker(context, PROCESS_POOL_WORKERS)
+            _process_pool = ProcessPoolExecutor(
+                max_workers=PROCESS_POOL_WORKERS,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(_task_tracker,),
+            )
+        return _process_pool, _task_tracker
+
+
+async def run_in_process(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a picklable, module-level callable in the process pool.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_process_pool(),
+        functools.partial(func, *args, **kwargs),
+    )
+
+
+async def run_in_process_with_timeout(
+    timeout_seconds: float,
+    func: Callable[..., T],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """
+    Run a picklable, module-level callable in the process pool with a time limit.
+
+    The limit is measured from when a worker starts the task, so time
+    spent queued behind other tasks does not count against it. A task
+    that overruns it is stuck, and ProcessPoolExecutor cannot cancel a
+    running task, so the pool is reset. A pool found broken (a worker
+    died) is reset as well, so the next call starts a fresh one.
+
+    Args:
+        timeout_seconds: Seconds the task may run
+        func: Callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+
+    Raises:
+        TimeoutError: If the task ran longer than timeout_seconds
+        BrokenProcessPool: If a worker died while the task was pending
+    """
+    pool, tracker = _current_pool()
+    task_id = next(_task_ids)
+
+    try:
+        future = asyncio.wrap_future(pool.submit(_run_tracked, task_id, func, args, kwargs))
+        while True:
+            done, _ = await asyncio.wait({future}, timeout=_DEADLINE_POLL_SECONDS)
+            if done:
+                return future.result()
+
+            started = tracker.started(task_id)
+            if started is not None and time.time() - started > timeout_seconds:
+                # Detach from the task before its worker is killed
+                future.cancel()
+                reset_process_pool(pool)
+                raise TimeoutError(f"Process pool task ran longer than {timeout_seconds:g}s.")
+    except BrokenProcessPool:
+        reset_process_pool(pool)
+        raise
+    except asyncio.CancelledError:
+        # Drop the task if it has not started yet
+        future.cancel()
+        raise
+
+
+def reset_process_pool(pool: Optional[ProcessPoolExecutor] = None) -> None:
+    """
+    Kill the process pool's workers; the next call starts a fresh pool.
+
+    Used when a task overruns its time limit: ProcessPoolExecutor cannot
+    cancel a running task, so its worker is terminated instead. Other
+    tasks running in the pool fail with BrokenProcessPool.
+
+    Args:
+        pool: Only reset if this is still the shared pool (default: any)
+    """
+    global _process_pool, _task_tracker
+    with _lock:
+        if pool is not None and pool is not _process_pool:
+            # Already replaced by another caller
+            return
+        pool, _process_pool, _task_tracker = _process_pool, None, None
+    if pool is not None:
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the process pool if it was started."""
+    global _process_pool, _task_tracker
+    with _lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+            _task_tracker = None
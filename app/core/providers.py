@@ -0,0 +1,158 @@
+# app/core/providers.py
+"""
+Lazily initialized shared resources (embedding model, Groq clients).
+
+Nothing heavy is loaded at import time: each resource is created on first
+use, or ahead of time by warm_up() in the FastAPI startup event. Set
+PRELOAD_EMBEDDING_MODEL=1 and run gunicorn with --preload to load the
+model weights once in the master so forked workers share them
+copy-on-write.
+"""
+import os
+import threading
+from typing import Any, Callable, Iterable, Optional
+
+from app.core.constants import (
+    get_async_groq_client,
+    get_embedding_model,
+    get_groq_client,
+)
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class LazyResource:
+    """Thread-safe, create-once holder for an expensive resource."""
+
+    def __init__(self, name: str, factory: Callable[[], Any], fork_safe: bool = True):
+        """
+        Initialize lazy resource.
+
+        Args:
+            name: Resource name used in logs and readiness reports
+            factory: Callable creating the resource
+            fork_safe: Whether a forked child may keep the parent's instance.
+                Network clients are not: their connection pools are dropped
+                in the child and recreated on next use.
+        """
+        self.name = name
+        self._factory = factory
+        self._fork_safe = fork_safe
+        self._value: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the resource has been created."""
+        return self._value is not None
+
+    def get(self) -> Any:
+        """
+        Get the resource, creating it on first use.
+
+        Returns:
+            The resource
+
+        Raises:
+            Exception: Whatever the factory raises; creation is retried on
+                the next call
+        """
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    logger.info(f"Initializing {self.name}...")
+                    self._value = self._factory()
+                    logger.info(f"{self.name} ready")
+        return self._value
+
+    def get_if_loaded(self) -> Optional[Any]:
+        """Get the resource without creating it."""
+        return self._value
+
+    def _after_fork_in_child(self) -> None:
+        # A lock held by another parent thread at fork time stays locked
+        self._lock = threading.Lock()
+        if not self._fork_safe:
+            self._value = None
+
+
+embedding_model = LazyResource("embedding model", get_embedding_model)
+groq_client = LazyResource("Groq client", get_groq_client, fork_safe=False)
+async_groq_client = LazyResource("async Groq client", get_async_groq_client, fork_safe=False)
+
+_resources = (embedding_model, groq_client, async_groq_client)
+
+# Set once warm_up() has run inference and touched every index
+_warm = threading.Event()
+
+
+def _after_fork_in_child() -> None:
+    for resource in _resources:
+        resource._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def preload() -> None:
+    """
+    Load the embedding model weights in the current process.
+
+    Only loads weights and runs no inference, so no native thread pools
+    are started before a pre-fork server forks its workers.
+    """
+    embedding_model.get()
+
+
+def is_warm() -> bool:
+    """Whether warm_up() has completed successfully."""
+    return _warm.is_set()
+
+
+def warm_up(stores: Iterable[Any] = ()) -> None:
+    """
+    Load the embedding model and run one query through every store.
+
+    Errors are logged rather than raised: requests will retry the lazy
+    initialization on first use.
+
+    Args:
+        stores: Loaded vector stores to exercise
+    """
+    try:
+        query_emb = embedding_model.get().encode(
+            ["warm up"],
+            normalize_embeddings=True,
+        ).astype("float32")
+
+        for store in stores:
+            state = store.state
+            if state.index is not None:
+                state.index.search(query_emb, 1)
+
+        _warm.set()
+        logger.info("Warm-up complete")
+    except Exception as e:
+        logger.error(f"Warm-up failed: {str(e)}")
+
+
+def warm_up_in_background(stores: Iterable[Any] = ()) -> threading.Thread:
+    """
+    Run warm_up() in a daemon thread.
+
+    Args:
+        stores: Loaded vector stores to exercise
+
+    Returns:
+        Started thread
+    """
+    thread = threading.Thread(
+        target=warm_up,
+        args=(list(stores),),
+        name="warm-up",
+        daemon=True,
+    )
+    thread.start()
+    return thread
@@ -1,11 +1,68 @@
 # app/database.py
 
-from typing import Generator
-from sqlalchemy import create_engine
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, Iterator
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
-from app.core.constants import DATABASE_URL
+from sqlalchemy.pool import QueuePool
+from app.core.constants import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT_SECONDS,
+)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self):
+        # Includes opening a new connection while the pool is below size
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        return connection
 
-engine = create_engine(DATABASE_URL)
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """Pool settings for a database URL (in-memory SQLite keeps its default pool)."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -20,4 +77,56 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Short-lived session for one unit of work.
+
+    Commits on success, rolls back on error, and always closes, so the
+    pooled connection is returned as soon as the block exits. Use it
+    around reads and writes rather than holding a session across slow
+    calls (e.g. LLM requests).
+    """
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    Connection pool usage.
+
+    Returns:
+        Dict with pool size, connections checked out, overflow in use,
+        and checkout wait statistics (if the pool is instrumented)
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__, "status": pool.status()}
+
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": DB_MAX_OVERFLOW,
+        })
+
+    if isinstance(pool, InstrumentedQueuePool):
+        with pool._stats_lock:
+            stats.update({
+                "checkouts": pool.checkouts,
+                "timeouts": pool.timeouts,
+                "wait_seconds_avg": pool.wait_seconds_total / pool.checkouts if pool.checkouts else 0.0,
+                "wait_seconds_max": pool.wait_seconds_max,
+            })
+
+    return stats
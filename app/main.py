@@ -4,13 +4,19 @@ Production-ready FastAPI application.
 Refactored with proper separation of concerns: routes, services, and utilities.
 """
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from app.core.logging import get_logger
+from app.core.constants import PRELOAD_EMBEDDING_MODEL, SNAPSHOT_POLL_SECONDS
+from app.core.executors import shutdown_cpu_executor, shutdown_process_pool
+from app.core import providers
 from app.api.v1 import create_api_router
 from app.services.vectorstore_service import (
     ProjectStoreService,
     ReviewStoreService,
     ResumeStoreService,
 )
+from app.services.embedding_service import embedding_service
+from app.services.snapshot_store import SnapshotWatcher
 from app.api.v1.endpoints import proposals, resumes, sync, debug
 
 logger = get_logger(__name__)
@@ -32,11 +38,23 @@ def create_app() -> FastAPI:
         description="Production-ready API for generating Upwork proposals",
     )
     
+    if PRELOAD_EMBEDDING_MODEL:
+        # Runs at import, i.e. in the master under `gunicorn --preload`
+        providers.preload()
+    
     # Initialize vector stores
     project_store = ProjectStoreService()
     review_store = ReviewStoreService()
     resume_store = ResumeStoreService()
     
+    # Picks up snapshots published by other worker processes
+    snapshot_watcher = SnapshotWatcher(
+        [project_store, review_store, resume_store],
+        interval=SNAPSHOT_POLL_SECONDS,
+    )
+    
+    stores_loaded = False
+    
     # ========================================================================
     # Startup Event
     # ========================================================================
@@ -44,6 +62,7 @@ def create_app() -> FastAPI:
     @app.on_event("startup")
     def startup_event():
         """Initialize stores and load data on application startup."""
+        nonlocal stores_loaded
         logger.info("Starting up application...")
         
         try:
@@ -61,7 +80,13 @@ def create_app() -> FastAPI:
             proposals.set_stores(project_store, review_store, resume_store)
             resumes.set_store(resume_store)
             sync.set_stores(project_store, review_store)
-            debug.set_store(project_store)
+            debug.set_stores(project_store, review_store, resume_store)
+            
+            snapshot_watcher.start()
+            stores_loaded = True
+            
+            # Load the model and touch the indexes without delaying startup
+            providers.warm_up_in_background([project_store, review_store, resume_store])
             
         except Exception as e:
             logger.error(f"Failed to initialize stores: {str(e)}")
@@ -72,9 +97,18 @@ def create_app() -> FastAPI:
     # ========================================================================
     
     @app.on_event("shutdown")
-    def shutdown_event():
+    async def shutdown_event():
         """Cleanup on application shutdown."""
         logger.info("Shutting down application...")
+        
+        snapshot_watcher.stop()
+        embedding_service.shutdown()
+        shutdown_cpu_executor()
+        shutdown_process_pool()
+        
+        client = providers.async_groq_client.get_if_loaded()
+        if client is not None:
+            await client.close()
     
     # ========================================================================
     # Health Check
@@ -88,6 +122,21 @@ def create_app() -> FastAPI:
             "version": "1.0.0"
         }
     
+    @app.get("/ready")
+    def readiness_check():
+        """Readiness probe: 503 until the model and indexes are warm."""
+        checks = {
+            "stores_loaded": stores_loaded,
+            "embedding_model_loaded": providers.embedding_model.is_loaded,
+            "warm": providers.is_warm(),
+        }
+        ready = all(checks.values())
+        
+        return JSONResponse(
+            status_code=200 if ready else 503,
+            content={"status": "ready" if ready else "starting", **checks},
+        )
+    
     # ========================================================================
     # Include Routers
     # ========================================================================
@@ -18,3 +18,11 @@ class ApplicationSession(Base):
     
     conversation_json = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class IntentCacheEntry(Base):
+    __tablename__ = "intent_cache"
+
+    key = Column(String(64), primary_key=True)
+    label = Column(String, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
@@ -0,0 +1,159 @@
+# app/services/embedding_cache.py
+"""
+Persistent embedding cache for bulk builds.
+
+Maps sha256(text) to its float32 embedding in a SQLite table, tagged with
+the model (and backend) that produced it. Store builds and syncs look
+rows up here before running the model, so rebuilding from an unchanged
+spreadsheet does no inference.
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.constants import (
+    EMBED_MODEL_ID,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_PATH,
+)
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# SQLite's default limit on host parameters per statement is 999
+_QUERY_CHUNK = 500
+
+
+class EmbeddingCache:
+    """SQLite table of (model, text hash) -> float32 embedding."""
+
+    def __init__(self, path: str, model_id: str, enabled: bool = True):
+        """
+        Initialize embedding cache.
+
+        Args:
+            path: SQLite database file
+            model_id: Model identifier; embeddings from other models are ignored
+            enabled: If False, lookups miss and writes are dropped
+        """
+        self.path = path
+        self.model_id = model_id
+        self.enabled = enabled
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+
+    def get_many(self, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up embeddings by text hash.
+
+        Args:
+            hashes: Text hashes
+
+        Returns:
+            Dict of hash -> embedding for the hashes found
+        """
+        if not self.enabled or not hashes:
+            return {}
+
+        unique = list(dict.fromkeys(hashes))
+        found: Dict[str, np.ndarray] = {}
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                for i in range(0, len(unique), _QUERY_CHUNK):
+                    chunk = unique[i:i + _QUERY_CHUNK]
+                    rows = conn.execute(
+                        "SELECT hash, vector FROM embeddings "
+                        f"WHERE model = ? AND hash IN ({','.join('?' * len(chunk))})",
+                        [self.model_id, *chunk],
+                    ).fetchall()
+                    for row_hash, vector in rows:
+                        found[row_hash] = np.frombuffer(vector, dtype="float32")
+
+                self._hits += len(found)
+                self._misses += len(unique) - len(found)
+        except sqlite3.Error as e:
+            # The cache is an optimization: fall back to the model
+            logger.warning(f"Embedding cache lookup failed: {str(e)}")
+            return {}
+
+        return found
+
+    def put_many(self, hashes: List[str], embeddings: np.ndarray) -> None:
+        """
+        Store embeddings by text hash.
+
+        Args:
+            hashes: Text hashes
+            embeddings: Row-aligned float32 embeddings
+        """
+        if not self.enabled or not hashes:
+            return
+
+        rows = [
+            (self.model_id, row_hash, np.ascontiguousarray(vector, dtype="float32").tobytes())
+            for row_hash, vector in zip(hashes, embeddings)
+        ]
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings (model, hash, vector) VALUES (?, ?, ?)",
+                        rows,
+                    )
+                self._writes += len(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for this process.
+
+        Returns:
+            Dict with hits, misses, hit rate, and writes
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "model": self.model_id,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "writes": self._writes,
+            }
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use, and again after a fork."""
+        if self._conn is None or self._pid != os.getpid():
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            # WAL lets other processes read while a build is writing
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, hash TEXT NOT NULL, vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, hash)) WITHOUT ROWID"
+            )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+
+# Shared by every vector store
+embedding_cache = EmbeddingCache(
+    EMBEDDING_CACHE_PATH,
+    EMBED_MODEL_ID,
+    enabled=EMBEDDING_CACHE_ENABLED,
+)
@@ -0,0 +1,246 @@
+# app/services/embedding_service.py
+"""
+Micro-batching front end for the embedding model.
+
+Concurrent encode calls are queued and grouped into batches of up to
+EMBEDDING_MAX_BATCH_SIZE texts, waiting at most EMBEDDING_MAX_WAIT_MS for
+a batch to fill. A fixed pool of worker threads runs the batches, so the
+model sees a few larger forward passes instead of many batch-of-one
+calls competing for the GIL and torch's intra-op threads.
+"""
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.core.constants import (
+    EMBEDDING_MAX_BATCH_SIZE,
+    EMBEDDING_MAX_WAIT_MS,
+    EMBEDDING_WORKERS,
+)
+from app.core.logging import get_logger
+from app.core.providers import embedding_model
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Request:
+    """Texts waiting to be embedded, with the future receiving the result."""
+    texts: List[str]
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class EmbeddingService:
+    """Queue and worker pool batching encode calls to one model."""
+
+    def __init__(
+        self,
+        model_factory: Callable[[], Any],
+        max_batch_size: int = EMBEDDING_MAX_BATCH_SIZE,
+        max_wait_ms: float = EMBEDDING_MAX_WAIT_MS,
+        workers: int = EMBEDDING_WORKERS,
+    ):
+        """
+        Initialize embedding service.
+
+        Args:
+            model_factory: Callable returning the SentenceTransformer model
+            max_batch_size: Maximum texts per forward pass
+            max_wait_ms: Maximum time a batch waits for more requests
+            workers: Number of worker threads running batches
+        """
+        self.model_factory = model_factory
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.workers = max(1, workers)
+
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+        if hasattr(os, "register_at_fork"):
+            # Worker threads do not survive fork; restart them in the child
+            os.register_at_fork(after_in_child=self._after_fork_in_child)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts through the batching queue.
+
+        Inputs larger than the maximum batch size are split into several
+        queued requests, so other callers' queries can interleave.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Normalized float32 embeddings of shape (len(texts), dim)
+        """
+        texts = list(texts)
+        if not texts:
+            return np.empty((0, 0), dtype="float32")
+
+        self._ensure_started()
+
+        requests = [
+            _Request(texts[i:i + self.max_batch_size])
+            for i in range(0, len(texts), self.max_batch_size)
+        ]
+        for request in requests:
+            self._queue.put(request)
+
+        with self._lock:
+            self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+
+        results = [request.future.result() for request in requests]
+        return results[0] if len(results) == 1 else np.vstack(results)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue and batching statistics.
+
+        Returns:
+            Dict with queue depth, batch-size histogram, and wait times
+        """
+        with self._lock:
+            batches = self._batches
+            return {
+                "workers": self.workers,
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_queue_depth,
+                "batches": batches,
+                "texts": self._texts,
+                "mean_batch_size": self._texts / batches if batches else 0.0,
+                "batch_size_histogram": dict(
+                    sorted(self._histogram.items(), key=lambda item: int(item[0][2:]))
+                ),
+                "mean_queue_wait_ms": self._wait_ms / self._requests if self._requests else 0.0,
+                "errors": self._errors,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads after the queued requests are served."""
+        with self._lock:
+            threads = self._threads
+            self._threads = []
+
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout=5)
+
+    def _ensure_started(self) -> None:
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._run,
+                    name=f"embedding-worker-{i}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _run(self) -> None:
+        carry: Optional[_Request] = None
+        stopping = False
+
+        while not stopping:
+            first = carry if carry is not None else self._queue.get()
+            carry = None
+            if first is None:
+                break
+
+            batch = [first]
+            size = len(first.texts)
+            deadline = time.monotonic() + self.max_wait
+
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                if size + len(request.texts) > self.max_batch_size:
+                    carry = request
+                    break
+                batch.append(request)
+                size += len(request.texts)
+
+            self._run_batch(batch)
+
+        if carry is not None:
+            self._run_batch([carry])
+
+    def _run_batch(self, batch: List[_Request]) -> None:
+        started = time.monotonic()
+        texts = [text for request in batch for text in request.texts]
+
+        try:
+            embeddings = self.model_factory().encode(
+                texts,
+                batch_size=len(texts),
+                normalize_embeddings=True,
+            ).astype("float32")
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(texts)} failed: {str(e)}")
+            with self._lock:
+                self._errors += 1
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        offset = 0
+        for request in batch:
+            # Copy so a cached result does not pin the whole batch
+            request.future.set_result(embeddings[offset:offset + len(request.texts)].copy())
+            offset += len(request.texts)
+
+        with self._lock:
+            self._batches += 1
+            self._texts += len(texts)
+            self._requests += len(batch)
+            self._wait_ms += sum((started - r.enqueued_at) * 1000 for r in batch)
+            bucket = self._bucket(len(texts))
+            self._histogram[bucket] = self._histogram.get(bucket, 0) + 1
+
+    def _bucket(self, size: int) -> str:
+        """Histogram bucket label: the smallest power of two >= size."""
+        upper = 1
+        while upper < size:
+            upper *= 2
+        return f"<={upper}"
+
+    def _reset_stats(self) -> None:
+        self._batches = 0
+        self._texts = 0
+        self._requests = 0
+        self._wait_ms = 0.0
+        self._errors = 0
+        self._max_queue_depth = 0
+        self._histogram: Dict[str, int] = {}
+
+    def _after_fork_in_child(self) -> None:
+        self._queue = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._reset_stats()
+
+
+# Shared by every vector store (all stores use the same model)
+embedding_service = EmbeddingService(embedding_model.get)
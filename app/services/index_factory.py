@@ -0,0 +1,281 @@
+# app/services/index_factory.py
+"""
+FAISS index construction for vector stores.
+
+Supports exact (Flat) and approximate (HNSW, IVF-Flat, IVF-PQ) inner
+product indexes, with a recall-vs-latency report against the Flat
+baseline.
+"""
+import math
+import time
+from typing import Any, Dict, List, Optional
+
+import faiss
+import numpy as np
+
+from app.core.constants import (
+    HNSW_M,
+    HNSW_EF_CONSTRUCTION,
+    HNSW_EF_SEARCH,
+    IVF_NLIST,
+    IVF_NPROBE,
+    IVFPQ_M,
+    IVFPQ_NBITS,
+)
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_TYPES = ("Flat", "HNSW", "IVF", "IVFPQ")
+
+
+def _nlist_for(n: int) -> int:
+    """Pick the number of IVF lists for n vectors."""
+    if IVF_NLIST > 0:
+        return min(IVF_NLIST, n)
+    return max(1, min(int(4 * math.sqrt(n)), n))
+
+
+def resolved_index_type(index_type: str, n: int, dim: int) -> str:
+    """
+    Get the index type actually built for n vectors of dim.
+
+    IVFPQ falls back to Flat when there are too few vectors to train its
+    codebooks or dim is not divisible by IVFPQ_M.
+
+    Args:
+        index_type: One of INDEX_TYPES
+        n: Number of vectors
+        dim: Embedding dimension
+
+    Returns:
+        Index type name
+
+    Raises:
+        ValueError: If index_type is unknown
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValueError(
+            f"Unknown index type '{index_type}'. Expected one of {INDEX_TYPES}."
+        )
+    if index_type == "IVFPQ" and (n < 2 ** IVFPQ_NBITS or dim % IVFPQ_M != 0):
+        return "Flat"
+    return index_type
+
+
+def needs_training(index_type: str) -> bool:
+    """Whether an index type must be trained before vectors are added."""
+    return index_type in ("IVF", "IVFPQ")
+
+
+def training_sample_size(index_type: str, n: int) -> int:
+    """
+    Number of vectors to train an index on.
+
+    Args:
+        index_type: One of INDEX_TYPES
+        n: Total number of vectors
+
+    Returns:
+        Sample size (0 if the type needs no training)
+    """
+    if not needs_training(index_type):
+        return 0
+    centroids = _nlist_for(n)
+    if index_type == "IVFPQ":
+        centroids = max(centroids, 2 ** IVFPQ_NBITS)
+    # FAISS warns below ~39 training points per centroid
+    return min(n, 64 * centroids)
+
+
+def create_index(
+    index_type: str,
+    dim: int,
+    n: int,
+    training: Optional[np.ndarray] = None,
+) -> faiss.Index:
+    """
+    Create an empty inner product index sized for n vectors.
+
+    Args:
+        index_type: One of INDEX_TYPES
+        dim: Embedding dimension
+        n: Number of vectors that will be added
+        training: Training vectors, required for IVF variants
+
+    Returns:
+        Empty (trained) FAISS index
+
+    Raises:
+        ValueError: If index_type is unknown
+    """
+    resolved = resolved_index_type(index_type, n, dim)
+    if resolved != index_type:
+        logger.warning(
+            f"Cannot build {index_type} index over {n} vectors of dim {dim}; "
+            f"using {resolved}."
+        )
+        index_type = resolved
+
+    if index_type == "HNSW":
+        index = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+
+    elif index_type == "IVF":
+        quantizer = faiss.IndexFlatIP(dim)
+        index = faiss.IndexIVFFlat(quantizer, dim, _nlist_for(n), faiss.METRIC_INNER_PRODUCT)
+
+    elif index_type == "IVFPQ":
+        quantizer = faiss.IndexFlatIP(dim)
+        index = faiss.IndexIVFPQ(
+            quantizer, dim, _nlist_for(n), IVFPQ_M, IVFPQ_NBITS, faiss.METRIC_INNER_PRODUCT
+        )
+
+    else:
+        index = faiss.IndexFlatIP(dim)
+
+    if needs_training(index_type):
+        index.train(np.ascontiguousarray(training, dtype="float32"))
+
+    return index
+
+
+def build_index(index_type: str, embeddings: np.ndarray) -> faiss.Index:
+    """
+    Build and populate an inner product index.
+
+    IVF variants are trained on the given embeddings. Falls back to Flat
+    when there are too few vectors to train on.
+
+    Args:
+        index_type: One of INDEX_TYPES
+        embeddings: Normalized float32 matrix of shape (N, dim)
+
+    Returns:
+        Populated FAISS index with search parameters applied
+
+    Raises:
+        ValueError: If index_type is unknown
+    """
+    n, dim = embeddings.shape
+    index = create_index(index_type, dim, n, training=embeddings)
+    index.add(embeddings)
+    configure_search(index)
+    return index
+
+
+def configure_search(index: faiss.Index) -> None:
+    """
+    Apply configured search-time parameters (efSearch, nprobe).
+
+    Search parameters are not persisted with the index, so this must be
+    called again after faiss.read_index.
+
+    Args:
+        index: FAISS index
+    """
+    if isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf.nprobe = min(IVF_NPROBE, ivf.nlist)
+
+
+def index_type_of(index: faiss.Index) -> str:
+    """
+    Get the INDEX_TYPES name of an index.
+
+    Args:
+        index: FAISS index
+
+    Returns:
+        Index type name
+    """
+    if isinstance(index, faiss.IndexHNSW):
+        return "HNSW"
+    if isinstance(index, faiss.IndexIVFPQ):
+        return "IVFPQ"
+    if isinstance(index, faiss.IndexIVFFlat):
+        return "IVF"
+    return "Flat"
+
+
+def _timed_search(index: faiss.Index, queries: np.ndarray, top_k: int):
+    """Search one query at a time, returning ids and per-query latency (ms)."""
+    ids = np.empty((len(queries), top_k), dtype="int64")
+    latencies = []
+    for i in range(len(queries)):
+        start = time.perf_counter()
+        _, found = index.search(queries[i:i + 1], top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        ids[i] = found[0]
+    return ids, np.array(latencies)
+
+
+def _latency_summary(latencies: np.ndarray) -> Dict[str, float]:
+    return {
+        "mean_ms": float(latencies.mean()),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+    }
+
+
+def benchmark_index_types(
+    embeddings: np.ndarray,
+    index_types: Optional[List[str]] = None,
+    sample_size: int = 200,
+    top_k: int = 10,
+) -> Dict[str, Any]:
+    """
+    Report recall@k and latency of index types against the Flat baseline.
+
+    Queries are sampled from the stored embeddings.
+
+    Args:
+        embeddings: Normalized float32 matrix of shape (N, dim)
+        index_types: Index types to evaluate (default: all)
+        sample_size: Number of query vectors to sample
+        top_k: Neighbours per query
+
+    Returns:
+        Dict with baseline latency and per-type recall, latency, build time
+    """
+    embeddings = np.ascontiguousarray(embeddings, dtype="float32")
+    n = len(embeddings)
+    top_k = min(top_k, n)
+
+    rng = np.random.default_rng(0)
+    sample = rng.choice(n, size=min(sample_size, n), replace=False)
+    queries = embeddings[sample]
+
+    baseline = build_index("Flat", embeddings)
+    truth, baseline_latencies = _timed_search(baseline, queries, top_k)
+
+    report = {
+        "vectors": n,
+        "queries": len(queries),
+        "top_k": top_k,
+        "baseline": _latency_summary(baseline_latencies),
+        "results": {},
+    }
+
+    for index_type in index_types or INDEX_TYPES:
+        start = time.perf_counter()
+        index = build_index(index_type, embeddings)
+        build_seconds = time.perf_counter() - start
+
+        found, latencies = _timed_search(index, queries, top_k)
+        hits = sum(
+            len(set(found_row[found_row >= 0]) & set(truth_row))
+            for found_row, truth_row in zip(found, truth)
+        )
+
+        report["results"][index_type] = {
+            "built_as": index_type_of(index),
+            "recall": hits / (len(queries) * top_k),
+            "build_seconds": build_seconds,
+            **_latency_summary(latencies),
+        }
+
+    return report
@@ -0,0 +1,153 @@
+# app/services/intent_cache.py
+"""
+Exact-match cache for intent classification.
+
+Classification runs at temperature 0 with a few output tokens, so the
+label is a pure function of the prompt inputs. Labels are kept in an
+in-process LRU+TTL cache keyed by a hash of the normalized inputs, and
+optionally in the database so they survive restarts.
+"""
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.constants import (
+    GROQ_MODEL,
+    INTENT_CACHE_PERSIST,
+    INTENT_CACHE_SIZE,
+    INTENT_CACHE_TTL_SECONDS,
+)
+from app.core.logging import get_logger
+from app.database import engine, session_scope
+from app.models import IntentCacheEntry
+from app.utils.cache import LRUTTLCache
+from app.utils.hashing import normalize_text, text_hash
+
+logger = get_logger(__name__)
+
+
+class IntentCache:
+    """LRU+TTL cache of classification labels, optionally backed by the DB."""
+
+    def __init__(self, max_size: int, ttl_seconds: float, persist: bool = False):
+        """
+        Initialize intent cache.
+
+        Args:
+            max_size: Maximum labels kept in memory
+            ttl_seconds: Seconds a label stays valid after being stored
+            persist: Also store labels in the intent_cache table
+        """
+        self.ttl_seconds = ttl_seconds
+        self.persist = persist
+        self._memory = LRUTTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self._table_ready = False
+        self._lock = threading.Lock()
+        self._db_hits = 0
+
+    @staticmethod
+    def key(kind: str, *inputs: Any) -> str:
+        """
+        Build a cache key from the classifier kind and its prompt inputs.
+
+        Strings are whitespace-normalized; other inputs (e.g. conversation
+        history) are serialized as JSON. The model name is included so a
+        model change does not reuse old labels.
+
+        Args:
+            kind: Classifier name
+            inputs: Prompt inputs
+
+        Returns:
+            Hex SHA-256 key
+        """
+        parts = [
+            normalize_text(value) if isinstance(value, str) else json.dumps(value, sort_keys=True)
+            for value in inputs
+        ]
+        return text_hash("\x1f".join([GROQ_MODEL, kind, *parts]))
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a label, in memory first and then in the database.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached label, or None on miss or expiry
+        """
+        label = self._memory.get(key)
+        if label is not None or not self.persist:
+            return label
+
+        try:
+            self._ensure_table()
+            with session_scope() as db:
+                entry = db.get(IntentCacheEntry, key)
+                if entry is None or entry.expires_at <= datetime.utcnow():
+                    return None
+                label = entry.label
+        except SQLAlchemyError as e:
+            # The cache is an optimization: fall back to the LLM
+            logger.warning(f"Intent cache lookup failed: {str(e)}")
+            return None
+
+        with self._lock:
+            self._db_hits += 1
+        self._memory.set(key, label)
+        return label
+
+    def set(self, key: str, label: str) -> None:
+        """
+        Store a label.
+
+        Args:
+            key: Cache key
+            label: Classification label
+        """
+        self._memory.set(key, label)
+        if not self.persist:
+            return
+
+        try:
+            self._ensure_table()
+            with session_scope() as db:
+                db.merge(IntentCacheEntry(
+                    key=key,
+                    label=label,
+                    expires_at=datetime.utcnow() + timedelta(seconds=self.ttl_seconds),
+                ))
+        except SQLAlchemyError as e:
+            logger.warning(f"Intent cache write failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            In-memory cache stats plus persistence settings and DB hits
+        """
+        with self._lock:
+            db_hits = self._db_hits
+        return {**self._memory.stats(), "persist": self.persist, "db_hits": db_hits}
+
+    def _ensure_table(self) -> None:
+        """Create the intent_cache table on first persistent use."""
+        if self._table_ready:
+            return
+        with self._lock:
+            if not self._table_ready:
+                IntentCacheEntry.__table__.create(bind=engine, checkfirst=True)
+                self._table_ready = True
+
+
+# Shared by every LLMService instance
+intent_cache = IntentCache(
+    max_size=INTENT_CACHE_SIZE,
+    ttl_seconds=INTENT_CACHE_TTL_SECONDS,
+    persist=INTENT_CACHE_PERSIST,
+)
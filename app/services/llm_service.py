@@ -3,7 +3,8 @@
 Service layer for LLM operations using Groq API.
 Handles proposal generation, intent classification, and follow-up answers.
 """
-from groq import Groq
+from typing import AsyncIterator, Optional
+from groq import Groq, AsyncGroq
 from app.core.constants import (
     GROQ_MODEL,
     PROPOSAL_TEMPERATURE,
@@ -17,6 +18,7 @@ from app.core.constants import (
 )
 from app.core.exceptions import LLMGenerationError
 from app.core.logging import get_logger
+from app.services.intent_cache import IntentCache, intent_cache
 
 logger = get_logger(__name__)
 
@@ -24,14 +26,19 @@ logger = get_logger(__name__)
 class LLMService:
     """Service for LLM-based operations."""
     
-    def __init__(self, client: Groq):
+    def __init__(self, client: Groq, async_client: Optional[AsyncGroq] = None):
         """
         Initialize LLM service.
         
         Args:
             client: Groq API client
+            async_client: Optional async Groq API client for async endpoints
         """
         self.client = client
+        self.async_client = async_client
+        self.intent_cache: IntentCache = intent_cache
+        # Token usage of the most recent generation, if reported
+        self.last_usage = None
     
     def classify_job_intent(self, text: str) -> bool:
         """
@@ -46,6 +53,12 @@ class LLMService:
         Raises:
             LLMGenerationError: If classification fails
         """
+        cache_key = self.intent_cache.key("job_intent", text)
+        cached = self.intent_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Job intent classification result (cached): {cached}")
+            return cached == "JOB_RELATED"
+        
         try:
             classification_prompt = f"""
                 You are an intent classifier.
@@ -91,32 +104,33 @@ class LLMService:
             
             result = response.choices[0].message.content.strip()
             logger.info(f"Job intent classification result: {result}")
-            return result == "JOB_RELATED"
+            
+            label = "JOB_RELATED" if result == "JOB_RELATED" else "NOT_JOB_RELATED"
+            self.intent_cache.set(cache_key, label)
+            return label == "JOB_RELATED"
             
         except Exception as e:
             logger.error(f"Failed to classify job intent: {str(e)}")
             raise LLMGenerationError(f"Intent classification failed: {str(e)}")
     
-    def generate_proposal(
-        self,
+    @staticmethod
+    def _build_proposal_messages(
         requirement: str,
         projects_text: str,
-    ) -> str:
+        draft: Optional[str] = None,
+    ) -> list:
         """
-        Generate Upwork proposal for a job requirement.
+        Build chat messages for proposal generation.
         
         Args:
             requirement: Job requirement text
             projects_text: Formatted project information
+            draft: Proposal written for a very similar job, to revise
             
         Returns:
-            Generated proposal text
-            
-        Raises:
-            LLMGenerationError: If proposal generation fails
+            List of chat messages
         """
-        try:
-            prompt = f"""
+        prompt = f"""
                 You are a senior software developer writing a real Upwork cover letter.
 
                 The resume content is included below.
@@ -210,17 +224,52 @@ class LLMService:
                 Make it feel like a senior engineer who has solved this in production.
             """
 
+        messages = [
+            {"role": "system", "content": GLOBAL_SCOPE_PROMPT},
+            {"role": "system", "content": "You are an expert freelance software developer."},
+            {"role": "user", "content": prompt},
+        ]
+        
+        if draft:
+            messages.append({
+                "role": "user",
+                "content": "Below is a proposal written earlier for a very similar job. "
+                           "Revise it for this requirement instead of starting over, "
+                           "keeping what still applies and following the rules above.\n\n"
+                           f"{draft}"
+            })
+        
+        return messages
+    
+    def generate_proposal(
+        self,
+        requirement: str,
+        projects_text: str,
+        draft: Optional[str] = None,
+    ) -> str:
+        """
+        Generate Upwork proposal for a job requirement.
+        
+        Args:
+            requirement: Job requirement text
+            projects_text: Formatted project information
+            draft: Proposal written for a very similar job, to revise
+            
+        Returns:
+            Generated proposal text
+            
+        Raises:
+            LLMGenerationError: If proposal generation fails
+        """
+        try:
             response = self.client.chat.completions.create(
                 model=GROQ_MODEL,
-                messages=[
-                    {"role": "system", "content": GLOBAL_SCOPE_PROMPT},
-                    {"role": "system", "content": "You are an expert freelance software developer."},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=self._build_proposal_messages(requirement, projects_text, draft),
                 temperature=PROPOSAL_TEMPERATURE,
                 max_tokens=PROPOSAL_MAX_TOKENS,
             )
             
+            self.last_usage = getattr(response, "usage", None)
             proposal = response.choices[0].message.content.strip()
             logger.info("Proposal generated successfully")
             return proposal
@@ -229,16 +278,129 @@ class LLMService:
             logger.error(f"Failed to generate proposal: {str(e)}")
             raise LLMGenerationError(f"Proposal generation failed: {str(e)}")
     
-    def generate_followup_answer(
+    async def generate_proposal_async(
         self,
+        requirement: str,
+        projects_text: str,
+        draft: Optional[str] = None,
+    ) -> str:
+        """
+        Generate Upwork proposal without blocking the event loop.
+        
+        Args:
+            requirement: Job requirement text
+            projects_text: Formatted project information
+            draft: Proposal written for a very similar job, to revise
+            
+        Returns:
+            Generated proposal text
+            
+        Raises:
+            LLMGenerationError: If proposal generation fails
+        """
+        if self.async_client is None:
+            raise LLMGenerationError("Async Groq client is not configured.")
+        
+        try:
+            response = await self.async_client.chat.completions.create(
+                model=GROQ_MODEL,
+                messages=self._build_proposal_messages(requirement, projects_text, draft),
+                temperature=PROPOSAL_TEMPERATURE,
+                max_tokens=PROPOSAL_MAX_TOKENS,
+            )
+            
+            self.last_usage = getattr(response, "usage", None)
+            proposal = response.choices[0].message.content.strip()
+            logger.info("Proposal generated successfully")
+            return proposal
+            
+        except Exception as e:
+            logger.error(f"Failed to generate proposal: {str(e)}")
+            raise LLMGenerationError(f"Proposal generation failed: {str(e)}")
+    
+    async def _stream_completion(
+        self,
+        messages: list,
+        temperature: float,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as text deltas.
+        
+        Args:
+            messages: Chat messages
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            
+        Yields:
+            Non-empty content deltas in arrival order
+        """
+        if self.async_client is None:
+            raise LLMGenerationError("Async Groq client is not configured.")
+        
+        stream = await self.async_client.chat.completions.create(
+            model=GROQ_MODEL,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+        
+        async for chunk in stream:
+            # Groq reports usage on the final chunk
+            usage = getattr(getattr(chunk, "x_groq", None), "usage", None)
+            if usage is not None:
+                self.last_usage = usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+    
+    async def stream_proposal(
+        self,
+        requirement: str,
+        projects_text: str,
+        draft: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream an Upwork proposal token by token.
+        
+        Args:
+            requirement: Job requirement text
+            projects_text: Formatted project information
+            draft: Proposal written for a very similar job, to revise
+            
+        Yields:
+            Proposal text deltas
+            
+        Raises:
+            LLMGenerationError: If proposal generation fails
+        """
+        try:
+            async for delta in self._stream_completion(
+                self._build_proposal_messages(requirement, projects_text, draft),
+                PROPOSAL_TEMPERATURE,
+                PROPOSAL_MAX_TOKENS,
+            ):
+                yield delta
+            
+            logger.info("Proposal streamed successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to stream proposal: {str(e)}")
+            raise LLMGenerationError(f"Proposal generation failed: {str(e)}")
+    
+    @staticmethod
+    def _build_followup_messages(
         requirement: str,
         resume_text: str,
         proposal_text: str,
         conversation: list,
         question: str,
-    ) -> str:
+    ) -> list:
         """
-        Generate answer to a follow-up question about the proposal.
+        Build chat messages for a follow-up answer.
         
         Args:
             requirement: Original job requirement
@@ -248,13 +410,9 @@ class LLMService:
             question: Follow-up question
             
         Returns:
-            Answer to the question
-            
-        Raises:
-            LLMGenerationError: If answer generation fails
+            List of chat messages
         """
-        try:
-            system_prompt = f"""
+        system_prompt = f"""
                 {GLOBAL_SCOPE_PROMPT}
 
                 You are a senior software developer answering Upwork screening questions.
@@ -282,18 +440,49 @@ class LLMService:
                 - Output ONLY the answer.
             """
 
-            messages = [
-                {"role": "system", "content": system_prompt}
-            ]
+        messages = [
+            {"role": "system", "content": system_prompt}
+        ]
 
-            # Inject entire conversation history (limited to reduce tokens)
-            messages.extend(conversation[-CONVERSATION_CONTEXT_LENGTH:])
+        # Inject entire conversation history (limited to reduce tokens)
+        messages.extend(conversation[-CONVERSATION_CONTEXT_LENGTH:])
 
-            # Add latest question
-            messages.append({
-                "role": "user",
-                "content": question
-            })
+        # Add latest question
+        messages.append({
+            "role": "user",
+            "content": question
+        })
+
+        return messages
+    
+    def generate_followup_answer(
+        self,
+        requirement: str,
+        resume_text: str,
+        proposal_text: str,
+        conversation: list,
+        question: str,
+    ) -> str:
+        """
+        Generate answer to a follow-up question about the proposal.
+        
+        Args:
+            requirement: Original job requirement
+            resume_text: Candidate's resume
+            proposal_text: Original proposal submitted
+            conversation: Conversation history
+            question: Follow-up question
+            
+        Returns:
+            Answer to the question
+            
+        Raises:
+            LLMGenerationError: If answer generation fails
+        """
+        try:
+            messages = self._build_followup_messages(
+                requirement, resume_text, proposal_text, conversation, question
+            )
 
             response = self.client.chat.completions.create(
                 model=GROQ_MODEL,
@@ -310,6 +499,46 @@ class LLMService:
             logger.error(f"Failed to generate follow-up answer: {str(e)}")
             raise LLMGenerationError(f"Follow-up answer generation failed: {str(e)}")
     
+    async def stream_followup_answer(
+        self,
+        requirement: str,
+        resume_text: str,
+        proposal_text: str,
+        conversation: list,
+        question: str,
+    ) -> AsyncIterator[str]:
+        """
+        Stream an answer to a follow-up question token by token.
+        
+        Args:
+            requirement: Original job requirement
+            resume_text: Candidate's resume
+            proposal_text: Original proposal submitted
+            conversation: Conversation history
+            question: Follow-up question
+            
+        Yields:
+            Answer text deltas
+            
+        Raises:
+            LLMGenerationError: If answer generation fails
+        """
+        try:
+            async for delta in self._stream_completion(
+                self._build_followup_messages(
+                    requirement, resume_text, proposal_text, conversation, question
+                ),
+                FOLLOWUP_TEMPERATURE,
+                FOLLOWUP_MAX_TOKENS,
+            ):
+                yield delta
+            
+            logger.info("Follow-up answer streamed successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to stream follow-up answer: {str(e)}")
+            raise LLMGenerationError(f"Follow-up answer generation failed: {str(e)}")
+    
     def classify_conversation_intent(
         self,
         requirement: str,
@@ -332,6 +561,14 @@ class LLMService:
         Raises:
             LLMGenerationError: If classification fails
         """
+        cache_key = self.intent_cache.key(
+            "conversation_intent", requirement, proposal, conversation, new_input
+        )
+        cached = self.intent_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Conversation intent classification (cached): {cached}")
+            return cached
+        
         try:
             prompt = f"""
                 You are a strict intent classifier.
@@ -393,11 +630,14 @@ class LLMService:
 
             # Force strict label extraction
             if "NEW_JOB_REQUIREMENT" in raw_output:
-                return "NEW_JOB_REQUIREMENT"
+                label = "NEW_JOB_REQUIREMENT"
             elif "FOLLOWUP_QUESTION" in raw_output:
-                return "FOLLOWUP_QUESTION"
+                label = "FOLLOWUP_QUESTION"
             else:
-                return "NOT_JOB_RELATED"
+                label = "NOT_JOB_RELATED"
+            
+            self.intent_cache.set(cache_key, label)
+            return label
                 
         except Exception as e:
             logger.error(f"Failed to classify conversation intent: {str(e)}")
@@ -0,0 +1,245 @@
+# app/services/proposal_cache.py
+"""
+Semantic cache of generated proposals.
+
+Reposted and near-identical job posts would otherwise each pay a full
+proposal generation. Entries are keyed by the resume used, the snapshot
+versions of the stores the proposal's context was retrieved from, and the
+requirement's embedding: a new requirement for the same resume and store
+versions whose cosine similarity to a cached one clears the threshold
+reuses that proposal (or, above the lower draft threshold, hands it to the
+LLM as a draft to revise). A sync or rollback publishes new versions, so
+proposals citing outdated projects or reviews stop matching.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.constants import (
+    PROPOSAL_CACHE_DRAFT_THRESHOLD,
+    PROPOSAL_CACHE_ENABLED,
+    PROPOSAL_CACHE_MAX_ENTRIES,
+    PROPOSAL_CACHE_THRESHOLD,
+    PROPOSAL_CACHE_TTL_SECONDS,
+)
+from app.core.logging import get_logger
+from app.utils.hashing import text_hash
+
+logger = get_logger(__name__)
+
+# Upper bounds of the best-similarity histogram buckets (last is open-ended)
+SIMILARITY_BUCKETS = (0.5, 0.7, 0.8, 0.85, 0.9, 0.95, 0.98, 1.0)
+
+
+@dataclass(frozen=True)
+class ProposalMatch:
+    """A cached proposal close enough to reuse."""
+    proposal: str
+    similarity: float
+    # "hit": return as is; "draft": revise with the LLM
+    kind: str
+
+
+@dataclass(frozen=True)
+class _Entry:
+    resume_key: str
+    context_versions: Tuple[Optional[int], ...]
+    embedding: np.ndarray
+    proposal: str
+    tokens: int
+    expires_at: float
+
+
+class ProposalCache:
+    """Thread-safe, bounded, TTL'd nearest-neighbour cache of proposals."""
+
+    def __init__(
+        self,
+        enabled: bool,
+        threshold: float,
+        draft_threshold: float,
+        ttl_seconds: float,
+        max_entries: int,
+    ):
+        """
+        Initialize proposal cache.
+
+        Args:
+            enabled: If False, lookups miss and stores are dropped
+            threshold: Minimum cosine similarity to return a cached proposal
+            draft_threshold: Minimum cosine similarity to use one as a draft
+                (0 disables drafts)
+            ttl_seconds: Seconds an entry stays valid after being stored
+            max_entries: Maximum entries kept (oldest are evicted first)
+        """
+        self.enabled = enabled
+        self.threshold = threshold
+        self.draft_threshold = draft_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._drafts = 0
+        self._misses = 0
+        self._tokens_saved = 0
+        self._histogram = [0] * len(SIMILARITY_BUCKETS)
+
+    @staticmethod
+    def resume_key(resume_text: str) -> str:
+        """Identify a resume by its content, however it was selected."""
+        return text_hash(resume_text)
+
+    def lookup(
+        self,
+        resume_text: str,
+        query_emb: np.ndarray,
+        context_versions: Tuple[Optional[int], ...] = (),
+    ) -> Optional[ProposalMatch]:
+        """
+        Find the most similar cached proposal for the same resume and context.
+
+        Args:
+            resume_text: Resume the proposal will be written from
+            query_emb: Normalized requirement embedding of shape (1, dim)
+            context_versions: Snapshot versions of the stores the context
+                was retrieved from
+
+        Returns:
+            ProposalMatch if one clears the draft or hit threshold, else None
+        """
+        if not self.enabled:
+            return None
+
+        resume_key = self.resume_key(resume_text)
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire(now)
+            candidates: List[_Entry] = [
+                entry for entry in self._entries.values()
+                if entry.resume_key == resume_key
+                and entry.context_versions == context_versions
+            ]
+
+            if not candidates:
+                self._misses += 1
+                return None
+
+            # Embeddings are L2-normalized, so the dot product is the cosine
+            similarities = np.stack([e.embedding for e in candidates]) @ query_emb.reshape(-1)
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            self._record_similarity(similarity)
+
+            if similarity >= self.threshold:
+                self._hits += 1
+                self._tokens_saved += candidates[best].tokens
+                kind = "hit"
+            elif self.draft_threshold > 0 and similarity >= self.draft_threshold:
+                self._drafts += 1
+                kind = "draft"
+            else:
+                self._misses += 1
+                return None
+
+        logger.info(f"Proposal cache {kind} (similarity {similarity:.3f})")
+        return ProposalMatch(candidates[best].proposal, similarity, kind)
+
+    def store(
+        self,
+        resume_text: str,
+        query_emb: np.ndarray,
+        proposal: str,
+        tokens: int = 0,
+        context_versions: Tuple[Optional[int], ...] = (),
+    ) -> None:
+        """
+        Cache a generated proposal.
+
+        Args:
+            resume_text: Resume the proposal was written from
+            query_emb: Normalized requirement embedding of shape (1, dim)
+            proposal: Generated proposal
+            tokens: Total tokens the generation used (saved on each hit)
+            context_versions: Snapshot versions of the stores the context
+                was retrieved from
+        """
+        if not self.enabled or self.max_entries <= 0:
+            return
+
+        entry = _Entry(
+            resume_key=self.resume_key(resume_text),
+            context_versions=tuple(context_versions),
+            embedding=np.array(query_emb, dtype="float32").reshape(-1),
+            proposal=proposal,
+            tokens=tokens,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+
+        with self._lock:
+            self._entries[self._next_id] = entry
+            self._next_id += 1
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hit/draft/miss counters, tokens saved, and a histogram
+            of the best similarity found per lookup
+        """
+        with self._lock:
+            lookups = self._hits + self._drafts + self._misses
+            lower = [0.0, *SIMILARITY_BUCKETS[:-1]]
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "threshold": self.threshold,
+                "draft_threshold": self.draft_threshold,
+                "hits": self._hits,
+                "drafts": self._drafts,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "tokens_saved": self._tokens_saved,
+                "similarity_histogram": {
+                    f"{low:.2f}-{high:.2f}": count
+                    for low, high, count in zip(lower, SIMILARITY_BUCKETS, self._histogram)
+                },
+            }
+
+    def _expire(self, now: float) -> None:
+        """Drop expired entries; caller holds the lock."""
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+    def _record_similarity(self, similarity: float) -> None:
+        """Count a best-match similarity in the histogram; caller holds the lock."""
+        for i, upper in enumerate(SIMILARITY_BUCKETS):
+            if similarity < upper or i == len(SIMILARITY_BUCKETS) - 1:
+                self._histogram[i] += 1
+                return
+
+
+# Shared by the proposal endpoints
+proposal_cache = ProposalCache(
+    enabled=PROPOSAL_CACHE_ENABLED,
+    threshold=PROPOSAL_CACHE_THRESHOLD,
+    draft_threshold=PROPOSAL_CACHE_DRAFT_THRESHOLD,
+    ttl_seconds=PROPOSAL_CACHE_TTL_SECONDS,
+    max_entries=PROPOSAL_CACHE_MAX_ENTRIES,
+)
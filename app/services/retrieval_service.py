@@ -0,0 +1,113 @@
+# app/services/retrieval_service.py
+"""
+Service layer for coordinated retrieval across vector stores.
+Embeds a query once and fans the vector out to the project, review,
+and resume stores, running the FAISS searches in parallel.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+from app.core.executors import get_cpu_executor, run_cpu_bound
+from app.core.logging import get_logger
+from app.services.vectorstore_service import (
+    ProjectStoreService,
+    ReviewStoreService,
+    ResumeStoreService,
+)
+
+logger = get_logger(__name__)
+
+
+class RetrievalService:
+    """Coordinates a single-embedding, multi-store retrieval."""
+
+    def __init__(
+        self,
+        project_store: ProjectStoreService,
+        review_store: ReviewStoreService,
+        resume_store: Optional[ResumeStoreService] = None,
+    ):
+        """
+        Initialize retrieval service.
+
+        Args:
+            project_store: Project vector store
+            review_store: Review vector store
+            resume_store: Optional resume vector store
+        """
+        self.project_store = project_store
+        self.review_store = review_store
+        self.resume_store = resume_store
+
+    def retrieve(self, query: str, include_resume: bool = True) -> Dict[str, Any]:
+        """
+        Retrieve projects, reviews, and optionally the best resume.
+
+        Blocks the calling thread; use from sync endpoints.
+
+        Args:
+            query: Search query
+            include_resume: Whether to run the semantic resume search
+
+        Returns:
+            Dict with projects_text, review_text, resume (or None), and
+            query_embedding
+
+        Raises:
+            VectorStoreError: If resume search is requested on an empty store
+        """
+        query_emb = self.project_store.encode_query(query)
+
+        executor = get_cpu_executor()
+        projects_future = executor.submit(self.project_store.search_by_vector, query_emb)
+        reviews_future = executor.submit(self.review_store.search_by_vector, query_emb)
+        resume_future = None
+        if include_resume and self.resume_store is not None:
+            resume_future = executor.submit(self.resume_store.search_by_vector, query_emb)
+
+        return {
+            "projects_text": projects_future.result(),
+            "review_text": reviews_future.result(),
+            "resume": resume_future.result() if resume_future else None,
+            "query_embedding": query_emb,
+        }
+
+    async def retrieve_async(
+        self,
+        query: str,
+        include_resume: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Retrieve projects, reviews, and optionally the best resume.
+
+        Runs embedding and searches on the CPU executor; use from async
+        endpoints.
+
+        Args:
+            query: Search query
+            include_resume: Whether to run the semantic resume search
+
+        Returns:
+            Dict with projects_text, review_text, resume (or None), and
+            query_embedding
+
+        Raises:
+            VectorStoreError: If resume search is requested on an empty store
+        """
+        query_emb = await run_cpu_bound(self.project_store.encode_query, query)
+
+        searches = [
+            run_cpu_bound(self.project_store.search_by_vector, query_emb),
+            run_cpu_bound(self.review_store.search_by_vector, query_emb),
+        ]
+        if include_resume and self.resume_store is not None:
+            searches.append(run_cpu_bound(self.resume_store.search_by_vector, query_emb))
+
+        results = await asyncio.gather(*searches)
+
+        return {
+            "projects_text": results[0],
+            "review_text": results[1],
+            "resume": results[2] if len(results) > 2 else None,
+            "query_embedding": query_emb,
+        }
@@ -0,0 +1,252 @@
+# app/services/row_table.py
+"""
+Columnar row storage for vector stores.
+
+Row texts, metadata, and content hashes are kept in an Arrow table that
+is memory-mapped from an Arrow IPC file, so loading a store does not
+materialize every document and texts are fetched lazily by row ID.
+"""
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pyarrow as pa
+
+from app.utils.hashing import text_hash
+
+ROW_SCHEMA = pa.schema([
+    ("text", pa.large_string()),
+    ("metadata", pa.string()),
+    ("hash", pa.string()),
+])
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize numpy scalars that pandas rows hand back."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_metadata(meta: Dict[str, Any]) -> str:
+    return json.dumps(meta, default=_json_default)
+
+
+class _ColumnView(Sequence):
+    """Read-only, lazily decoded view over one column of a RowTable."""
+
+    def __init__(self, table: pa.Table, column: str, decode=None):
+        self._column = table.column(column)
+        self._decode = decode
+
+    def __len__(self) -> int:
+        return len(self._column)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        value = self._column[int(i)].as_py()
+        return self._decode(value) if self._decode else value
+
+    def __iter__(self):
+        for chunk in self._column.iterchunks():
+            for value in chunk:
+                value = value.as_py()
+                yield self._decode(value) if self._decode else value
+
+
+class RowTable:
+    """Immutable table of row texts, metadata, and content hashes."""
+
+    def __init__(self, table: Optional[pa.Table] = None):
+        """
+        Initialize row table.
+
+        Args:
+            table: Arrow table with ROW_SCHEMA, or None for an empty table
+        """
+        self._table = table if table is not None else ROW_SCHEMA.empty_table()
+
+    @classmethod
+    def from_rows(
+        cls,
+        texts: Iterable[str],
+        metadata: Iterable[Dict[str, Any]],
+        hashes: Optional[Iterable[str]] = None,
+    ) -> "RowTable":
+        """
+        Build a table from Python rows.
+
+        Args:
+            texts: Row texts
+            metadata: Row-aligned metadata dicts
+            hashes: Row-aligned content hashes (computed if omitted)
+
+        Returns:
+            New RowTable
+        """
+        texts = list(texts)
+        if hashes is None:
+            hashes = [text_hash(text) for text in texts]
+
+        return cls(pa.table(
+            {
+                "text": pa.array(texts, type=pa.large_string()),
+                "metadata": pa.array(
+                    [_encode_metadata(meta) for meta in metadata],
+                    type=pa.string(),
+                ),
+                "hash": pa.array(list(hashes), type=pa.string()),
+            },
+            schema=ROW_SCHEMA,
+        ))
+
+    @classmethod
+    def open(cls, path: str) -> "RowTable":
+        """
+        Memory-map a table from an Arrow IPC file.
+
+        Args:
+            path: Path to the Arrow IPC file
+
+        Returns:
+            RowTable backed by the mapped file
+        """
+        source = pa.memory_map(str(path), "r")
+        return cls(pa.ipc.open_file(source).read_all())
+
+    def write(self, path: str) -> None:
+        """
+        Write the table to an Arrow IPC file.
+
+        Writes to a temp file and renames it into place, so a table that
+        is currently memory-mapped from path stays valid.
+
+        Args:
+            path: Destination path
+        """
+        tmp_path = f"{path}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, ROW_SCHEMA) as writer:
+                writer.write_table(self._table)
+        os.replace(tmp_path, path)
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    @property
+    def texts(self) -> Sequence:
+        """Lazy view of row texts."""
+        return _ColumnView(self._table, "text")
+
+    @property
+    def metadata(self) -> Sequence:
+        """Lazy view of row metadata dicts."""
+        return _ColumnView(self._table, "metadata", decode=json.loads)
+
+    def hashes(self) -> List[str]:
+        """
+        Get all row content hashes.
+
+        Returns:
+            List of hex SHA-256 digests, row-aligned
+        """
+        return self._table.column("hash").to_pylist()
+
+    def append(self, text: str, meta: Dict[str, Any]) -> "RowTable":
+        """
+        Return a new table with one row appended.
+
+        Existing chunks are shared, not copied.
+
+        Args:
+            text: Row text
+            meta: Row metadata
+
+        Returns:
+            New RowTable
+        """
+        row = RowTable.from_rows([text], [meta])._table
+        return RowTable(pa.concat_tables([self._table, row]))
+
+    def delete(self, positions: List[int]) -> "RowTable":
+        """
+        Return a new table without the given row positions.
+
+        Args:
+            positions: Row positions to drop
+
+        Returns:
+            New RowTable
+        """
+        keep = np.ones(len(self), dtype=bool)
+        keep[positions] = False
+        return RowTable(self._table.filter(pa.array(keep)))
+
+
+class RowTableWriter:
+    """Appends row batches to an Arrow IPC file without keeping them in memory."""
+
+    def __init__(self, path: str):
+        """
+        Open a row table file for writing.
+
+        Args:
+            path: Destination path
+        """
+        self._sink = pa.OSFile(str(path), "wb")
+        self._writer = pa.ipc.new_file(self._sink, ROW_SCHEMA)
+
+    def write(
+        self,
+        texts: List[str],
+        metadata: List[Dict[str, Any]],
+        hashes: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Append a batch of rows.
+
+        Args:
+            texts: Row texts
+            metadata: Row-aligned metadata dicts
+            hashes: Row-aligned content hashes (computed if omitted)
+        """
+        self._writer.write_table(RowTable.from_rows(texts, metadata, hashes)._table)
+
+    def close(self) -> None:
+        """Finish the file."""
+        self._writer.close()
+        self._sink.close()
+
+    def __enter__(self) -> "RowTableWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_legacy_pickle(path: str) -> Optional[RowTable]:
+    """
+    Load rows from the pickle format used before the Arrow store.
+
+    Args:
+        path: Path to the legacy (texts, metadata[, hashes]) pickle
+
+    Returns:
+        RowTable, or None if the file does not exist
+    """
+    import pickle
+
+    if not Path(path).exists():
+        return None
+
+    with open(path, "rb") as f:
+        meta = pickle.load(f)
+
+    hashes = meta[2] if len(meta) > 2 else None
+    return RowTable.from_rows(meta[0], meta[1], hashes)
@@ -0,0 +1,263 @@
+# app/services/snapshot_store.py
+"""
+Versioned, crash-safe snapshot persistence for vector stores.
+
+Each save writes a complete snapshot (index, embeddings, rows) into a
+fresh version directory, fsyncs it, and then atomically replaces a small
+MANIFEST.json pointing at it. Readers only ever follow the manifest, so
+they never see a half-written store, and older versions are kept for
+rollback.
+
+Layout:
+    <root>/MANIFEST.json
+    <root>/v000001/...
+    <root>/v000002/...
+"""
+import json
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from filelock import FileLock
+
+from app.core.exceptions import VectorStoreError
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_NAME = "MANIFEST.json"
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file, or a directory entry on POSIX, to disk."""
+    if path.is_dir() and os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class SnapshotStore:
+    """Manages versioned snapshot directories and the manifest for one store."""
+
+    def __init__(self, root: str, retention: int):
+        """
+        Initialize snapshot store.
+
+        Args:
+            root: Directory holding the manifest and version directories
+            retention: Number of versions kept for rollback
+        """
+        self.root = Path(root)
+        self.retention = max(1, retention)
+        self._lock = FileLock(str(self.root) + ".lock")
+
+    def manifest(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the current manifest.
+
+        Returns:
+            Manifest dict, or None if no snapshot has been published
+        """
+        try:
+            with open(self.root / MANIFEST_NAME, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def current_version(self) -> Optional[int]:
+        """
+        Get the published version number.
+
+        Returns:
+            Version number, or None if no snapshot has been published
+        """
+        manifest = self.manifest()
+        return manifest["version"] if manifest else None
+
+    def version_dir(self, version: int) -> Path:
+        """
+        Get the directory of a version.
+
+        Args:
+            version: Version number
+
+        Returns:
+            Path of the version directory
+        """
+        return self.root / f"v{version:06d}"
+
+    def versions(self) -> List[int]:
+        """
+        List versions present on disk.
+
+        Returns:
+            Sorted version numbers
+        """
+        if not self.root.exists():
+            return []
+        return sorted(
+            int(p.name[1:]) for p in self.root.iterdir()
+            if p.is_dir() and p.name.startswith("v") and p.name[1:].isdigit()
+        )
+
+    def lock(self) -> FileLock:
+        """
+        Get the inter-process writer lock.
+
+        The lock is reentrant, so a writer can hold it across a whole
+        read-modify-write, including the write() call that publishes.
+
+        Returns:
+            FileLock shared by every writer of this store
+        """
+        self.root.parent.mkdir(parents=True, exist_ok=True)
+        return self._lock
+
+    def write(
+        self,
+        write_files: Callable[[Path], None],
+        base_version: Optional[int],
+        **info: Any,
+    ) -> int:
+        """
+        Write and publish a new snapshot.
+
+        Args:
+            write_files: Callable writing the snapshot files into a directory
+            base_version: Published version the snapshot was derived from
+            **info: Extra fields recorded in the manifest
+
+        Returns:
+            Published version number
+
+        Raises:
+            VectorStoreError: If another version was published since base_version
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            current = self.current_version()
+            if current != base_version:
+                # Publishing would silently drop the other writer's changes
+                raise VectorStoreError(
+                    f"Snapshot {current} of {self.root} was published after "
+                    f"version {base_version} was loaded; reload and retry."
+                )
+
+            version = max(self.versions() + [current or 0]) + 1
+            tmp_dir = self.root / f".tmp-v{version:06d}-{os.getpid()}"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir()
+
+            try:
+                write_files(tmp_dir)
+                for path in tmp_dir.iterdir():
+                    _fsync_path(path)
+                _fsync_path(tmp_dir)
+
+                os.rename(tmp_dir, self.version_dir(version))
+                _fsync_path(self.root)
+            except Exception:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+
+            self._publish(version, **info)
+            self._prune()
+
+        return version
+
+    def rollback(self, version: int) -> None:
+        """
+        Re-publish an older version.
+
+        Args:
+            version: Version number to make current
+
+        Raises:
+            FileNotFoundError: If the version is no longer on disk
+        """
+        with self._lock:
+            if not self.version_dir(version).is_dir():
+                raise FileNotFoundError(f"Snapshot version {version} not found.")
+
+            previous = self.manifest() or {}
+            info = {k: v for k, v in previous.items() if k not in ("version", "path", "published_at")}
+            self._publish(version, rolled_back_from=previous.get("version"), **info)
+
+    def _publish(self, version: int, **info: Any) -> None:
+        """Atomically point the manifest at a version."""
+        manifest = {
+            "version": version,
+            "path": self.version_dir(version).name,
+            "published_at": datetime.now(timezone.utc).isoformat(),
+            **info,
+        }
+
+        tmp_path = self.root / f".{MANIFEST_NAME}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, self.root / MANIFEST_NAME)
+        _fsync_path(self.root)
+        logger.info(f"Published snapshot {self.root}/{manifest['path']}")
+
+    def _prune(self) -> None:
+        """Delete all but the newest `retention` versions, keeping the current one."""
+        current = self.current_version()
+        for version in self.versions()[:-self.retention]:
+            if version == current:
+                continue
+            try:
+                shutil.rmtree(self.version_dir(version))
+            except OSError as e:
+                # Another process may still hold files open (e.g. on Windows)
+                logger.warning(f"Could not prune snapshot {version}: {str(e)}")
+
+
+class SnapshotWatcher:
+    """Background thread reloading stores when another process publishes."""
+
+    def __init__(self, stores: Iterable[Any], interval: float):
+        """
+        Initialize watcher.
+
+        Args:
+            stores: Vector stores exposing refresh_if_stale()
+            interval: Seconds between manifest checks
+        """
+        self.stores = list(stores)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="snapshot-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            for store in self.stores:
+                try:
+                    store.refresh_if_stale()
+                except Exception as e:
+                    logger.error(f"Snapshot refresh failed: {str(e)}")
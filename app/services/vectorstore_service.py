@@ -4,163 +4,823 @@ Service layer for vector store operations.
 Manages FAISS indices for projects, reviews, and resumes.
 """
 import faiss
+import os
+import shutil
+import time
 import pandas as pd
 import numpy as np
-import pickle
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 
 from app.core.constants import (
-    embedding_model,
-    PROJECTS_INDEX_PATH,
-    PROJECTS_META_PATH,
-    REVIEWS_INDEX_PATH,
-    REVIEWS_META_PATH,
-    RESUMES_INDEX_PATH,
-    RESUMES_META_PATH,
+    EMBED_MODEL_ID,
+    QUERY_EMBEDDING_CACHE_SIZE,
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+    PROJECTS_STORE_DIR,
+    PROJECTS_INDEX_TYPE,
+    REVIEWS_STORE_DIR,
+    REVIEWS_INDEX_TYPE,
+    RESUMES_STORE_DIR,
+    SNAPSHOT_RETENTION,
     DEFAULT_TOP_K_PROJECTS,
     DEFAULT_TOP_K_REVIEWS,
     DEFAULT_TOP_K_RESUMES,
     PROJECT_SHEETS,
+    BUILD_CHUNK_ROWS,
+    EXCEL_PARSE_WORKERS,
 )
 from app.core.exceptions import VectorStoreError, ResumeNotFoundError
 from app.core.logging import get_logger
+from app.services.embedding_cache import EmbeddingCache, embedding_cache
+from app.services.embedding_service import EmbeddingService, embedding_service
+from app.services.index_factory import (
+    benchmark_index_types,
+    build_index,
+    configure_search,
+    create_index,
+    index_type_of,
+    needs_training,
+    resolved_index_type,
+    training_sample_size,
+)
+from app.services.row_table import RowTable, RowTableWriter, load_legacy_pickle
+from app.services.snapshot_store import SnapshotStore
+from app.utils.cache import LRUTTLCache
+from app.utils.hashing import normalize_text, text_hash
+from app.utils.spreadsheet import (
+    iter_dataframe_chunks,
+    iter_excel_chunks,
+    read_sheets_parallel,
+    text_column,
+)
 
 logger = get_logger(__name__)
 
+# (texts, metadata, embeddings or None to embed them)
+RowBatch = Tuple[List[str], List[Dict[str, Any]], Optional[np.ndarray]]
+# Called with (rows built so far, rows per second)
+ProgressCallback = Callable[[int, float], None]
+
+# Query embeddings shared by every store (all stores use the same model)
+query_embedding_cache = LRUTTLCache(
+    max_size=QUERY_EMBEDDING_CACHE_SIZE,
+    ttl_seconds=QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+)
+
+
+@dataclass(frozen=True)
+class StoreState:
+    """
+    Immutable, row-aligned contents of a vector store.
+    
+    Stores publish a new StoreState with a single reference swap, so
+    readers that take one reference always see a matching index, rows,
+    and embeddings.
+    """
+    index: Optional[faiss.Index] = None
+    rows: RowTable = field(default_factory=RowTable)
+    embeddings: Optional[np.ndarray] = None
+    version: Optional[int] = None
+
 
 class VectorStoreService:
-    """Base service for FAISS vector store operations."""
+    """
+    Base service for FAISS vector store operations.
+    
+    Reads are lock-free: they take the current StoreState once and use
+    it throughout. Writers are serialized by a lock and build the next
+    state off to the side before publishing it.
+    """
+    
+    # Metadata fields identifying a logical row across syncs
+    SYNC_KEY_FIELDS: Tuple[str, ...] = ()
     
-    def __init__(self, index_path: str, meta_path: str):
+    # File names inside each snapshot version directory
+    INDEX_FILE = "index.faiss"
+    ROWS_FILE = "rows.arrow"
+    EMBEDDINGS_FILE = "embeddings.npy"
+    
+    def __init__(self, store_dir: str, index_type: str = "Flat"):
         """
         Initialize vector store service.
         
         Args:
-            index_path: Path to FAISS index file
-            meta_path: Path to metadata pickle file
+            store_dir: Directory holding versioned snapshots of the store
+            index_type: FAISS index type (see index_factory.INDEX_TYPES)
         """
-        self.index_path = index_path
-        self.meta_path = meta_path
-        self.model = embedding_model
-        self.index: Optional[faiss.IndexFlatIP] = None
-        self.texts: List[str] = []
-        self.metadata: List[Dict[str, Any]] = []
+        self.store_dir = store_dir
+        self.snapshots = SnapshotStore(store_dir, SNAPSHOT_RETENTION)
+        self.index_type = index_type
+        self.embedder: EmbeddingService = embedding_service
+        self.embedding_cache: EmbeddingCache = embedding_cache
+        self._state = StoreState()
+        self._write_lock = threading.RLock()
+    
+    @property
+    def state(self) -> StoreState:
+        """Current published contents; take once per read operation."""
+        return self._state
+    
+    def _publish(self, **changes: Any) -> None:
+        """Atomically replace the published state with updated fields."""
+        self._state = replace(self._state, **changes)
+    
+    @property
+    def index(self) -> Optional[faiss.Index]:
+        """Current FAISS index."""
+        return self._state.index
+    
+    @property
+    def rows(self) -> RowTable:
+        """Current row texts, metadata, and content hashes."""
+        return self._state.rows
+    
+    @property
+    def embeddings(self) -> Optional[np.ndarray]:
+        """Current row-aligned float32 (N, dim) embedding matrix."""
+        return self._state.embeddings
+    
+    @property
+    def version(self) -> Optional[int]:
+        """Snapshot version the current state was loaded from or saved as."""
+        return self._state.version
+    
+    @property
+    def texts(self) -> Sequence[str]:
+        """Row texts, fetched lazily by row ID."""
+        return self.rows.texts
+    
+    @property
+    def metadata(self) -> Sequence[Dict[str, Any]]:
+        """Row metadata, decoded lazily by row ID."""
+        return self.rows.metadata
+    
+    @property
+    def row_hashes(self) -> List[str]:
+        """Content hash of each row's text."""
+        return self.rows.hashes()
     
     def load(self) -> None:
-        """Load vector store from disk."""
-        try:
-            index_exists = Path(self.index_path).exists()
-            meta_exists = Path(self.meta_path).exists()
-            
-            if not index_exists or not meta_exists:
-                logger.info(f"Store not found at {self.index_path}. Creating empty store.")
-                self.index = None
-                self.texts = []
-                self.metadata = []
-                return
-            
-            self.index = faiss.read_index(str(self.index_path))
-            with open(self.meta_path, "rb") as f:
-                self.texts, self.metadata = pickle.load(f)
-            
-            logger.info(f"Loaded {len(self.texts)} items from vector store")
+        """Load the current snapshot of the vector store from disk."""
+        with self._write_lock:
+            try:
+                version = self.snapshots.current_version()
+                
+                if version is None:
+                    # Pre-snapshot layout: files next to the store directory,
+                    # migrated into a snapshot on the next save
+                    state = self._load_files(
+                        index_path=f"{self.store_dir}.faiss",
+                        meta_path=f"{self.store_dir}_meta.arrow",
+                        embeddings_path=f"{self.store_dir}_embeddings.npy",
+                    )
+                else:
+                    directory = self.snapshots.version_dir(version)
+                    state = self._load_files(
+                        index_path=str(directory / self.INDEX_FILE),
+                        meta_path=str(directory / self.ROWS_FILE),
+                        embeddings_path=str(directory / self.EMBEDDINGS_FILE),
+                    )
+                
+                expected_type = (
+                    resolved_index_type(self.index_type, len(state.rows), state.index.d)
+                    if state.index is not None
+                    else None
+                )
+                if expected_type is not None and index_type_of(state.index) != expected_type:
+                    # Index type changed in config: rebuild from stored
+                    # vectors in memory; it is persisted on the next save
+                    logger.info(
+                        f"Rebuilding {self.store_dir} as {expected_type} "
+                        f"(was {index_type_of(state.index)})"
+                    )
+                    self._state = replace(
+                        state,
+                        index=self._build_index(state.embeddings),
+                        version=version,
+                    )
+                else:
+                    if state.index is not None:
+                        configure_search(state.index)
+                    self._state = replace(state, version=version)
+                
+                logger.info(f"Loaded {len(self.rows)} items from vector store (version {self.version})")
+                
+            except Exception as e:
+                logger.error(f"Failed to load vector store: {str(e)}")
+                raise VectorStoreError(f"Failed to load vector store: {str(e)}")
+    
+    def _load_files(self, index_path: str, meta_path: str, embeddings_path: str) -> StoreState:
+        """
+        Load index, rows, and embeddings from their files.
+        
+        Args:
+            index_path: Path to FAISS index file
+            meta_path: Path to row table file (Arrow IPC)
+            embeddings_path: Path to raw embedding matrix (.npy)
             
-        except Exception as e:
-            logger.error(f"Failed to load vector store: {str(e)}")
-            raise VectorStoreError(f"Failed to load vector store: {str(e)}")
+        Returns:
+            Loaded state (empty if the files do not exist)
+        """
+        rows = self._load_rows(meta_path)
+        
+        if not Path(index_path).exists() or rows is None:
+            logger.info(f"Store not found at {self.store_dir}. Creating empty store.")
+            return StoreState()
+        
+        index = faiss.read_index(index_path)
+        return StoreState(
+            index=index,
+            rows=rows,
+            embeddings=self._load_embeddings(embeddings_path, index, len(rows)),
+        )
+    
+    @staticmethod
+    def _load_rows(meta_path: str) -> Optional[RowTable]:
+        """
+        Memory-map the row table.
+        
+        Falls back to the legacy pickle next to it; the store is migrated
+        to the Arrow format on the next save.
+        
+        Args:
+            meta_path: Path to row table file (Arrow IPC)
+        
+        Returns:
+            RowTable, or None if the store has no rows on disk
+        """
+        if Path(meta_path).exists():
+            return RowTable.open(meta_path)
+        
+        rows = load_legacy_pickle(str(Path(meta_path).with_suffix(".pkl")))
+        if rows is not None:
+            logger.info(f"Loaded legacy pickle metadata for {meta_path}")
+        return rows
+    
+    @staticmethod
+    def _load_embeddings(
+        embeddings_path: str,
+        index: faiss.Index,
+        num_rows: int,
+    ) -> np.ndarray:
+        """
+        Load the embedding matrix, memory-mapped read-only.
+        
+        Stores saved before embeddings were persisted recover the vectors
+        from the flat index (the only type they could have) instead of
+        re-encoding.
+        
+        Args:
+            embeddings_path: Path to raw embedding matrix (.npy)
+            index: Loaded FAISS index
+            num_rows: Number of rows in the store
+        
+        Returns:
+            Embedding matrix row-aligned with texts
+        """
+        if Path(embeddings_path).exists():
+            embeddings = np.load(embeddings_path, mmap_mode="r")
+            if embeddings.shape[0] == num_rows:
+                return embeddings
+            logger.warning(
+                f"Embedding matrix at {embeddings_path} has "
+                f"{embeddings.shape[0]} rows, expected {num_rows}. "
+                "Recovering from index."
+            )
+        
+        return index.reconstruct_n(0, index.ntotal)
     
     def save(self) -> None:
-        """Save vector store to disk."""
+        """
+        Save vector store to disk as a new snapshot version.
+        
+        The snapshot is fully written and fsynced before the manifest is
+        atomically switched to it.
+        """
+        state = self._state
+        
+        def write_files(directory: Path) -> None:
+            if state.index is not None:
+                faiss.write_index(state.index, str(directory / self.INDEX_FILE))
+            if state.embeddings is not None:
+                np.save(directory / self.EMBEDDINGS_FILE, np.ascontiguousarray(state.embeddings))
+            state.rows.write(str(directory / self.ROWS_FILE))
+        
         try:
-            Path(self.index_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            if self.index is not None:
-                faiss.write_index(self.index, str(self.index_path))
+            with self._write_lock:
+                version = self.snapshots.write(
+                    write_files,
+                    base_version=state.version,
+                    rows=len(state.rows),
+                    index_type=index_type_of(state.index) if state.index is not None else None,
+                )
+                if self._state is state:
+                    self._publish(version=version)
             
-            with open(self.meta_path, "wb") as f:
-                pickle.dump((self.texts, self.metadata), f)
-            
-            logger.info(f"Saved vector store with {len(self.texts)} items")
+            logger.info(f"Saved vector store with {len(state.rows)} items (version {version})")
             
         except Exception as e:
             logger.error(f"Failed to save vector store: {str(e)}")
             raise VectorStoreError(f"Failed to save vector store: {str(e)}")
     
+    def refresh_if_stale(self) -> bool:
+        """
+        Reload if another process published a newer snapshot.
+        
+        Returns:
+            True if the store was reloaded
+        """
+        version = self.snapshots.current_version()
+        if version is None or version == self.version:
+            return False
+        
+        with self._write_lock:
+            if self.snapshots.current_version() == self.version:
+                return False
+            
+            logger.info(f"Snapshot {version} published for {self.store_dir}; reloading")
+            self.load()
+            return True
+    
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """
+        Serialize a read-modify-write with writers in this and other processes.
+        
+        Holds the write lock and the snapshot file lock, and first reloads
+        any snapshot another process published, so the change is applied
+        to the latest version rather than overwriting it.
+        """
+        with self._write_lock, self.snapshots.lock():
+            self.refresh_if_stale()
+            yield
+    
+    def rollback(self, version: int) -> None:
+        """
+        Publish an earlier snapshot version and load it.
+        
+        Args:
+            version: Snapshot version to restore
+            
+        Raises:
+            VectorStoreError: If the version is not available
+        """
+        with self._write_lock:
+            try:
+                self.snapshots.rollback(version)
+            except FileNotFoundError as e:
+                raise VectorStoreError(str(e))
+            
+            self.load()
+        logger.info(f"Rolled back {self.store_dir} to version {version}")
+    
+    def snapshot_info(self) -> Dict[str, Any]:
+        """
+        Describe available snapshots.
+        
+        Returns:
+            Dict with the published manifest and versions on disk
+        """
+        return {
+            "loaded_version": self.version,
+            "manifest": self.snapshots.manifest(),
+            "versions": self.snapshots.versions(),
+        }
+    
     def _add_embeddings(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for texts.
         
+        Texts already in the persistent embedding cache are not
+        re-encoded; newly encoded texts are added to it.
+        
         Args:
             texts: List of text strings
             
         Returns:
             Numpy array of embeddings
         """
-        embeddings = self.model.encode(
-            texts,
-            normalize_embeddings=True,
-        ).astype("float32")
-        return np.array(embeddings)
+        hashes = [text_hash(text) for text in texts]
+        cached = self.embedding_cache.get_many(hashes)
+        
+        missing = [i for i, row_hash in enumerate(hashes) if row_hash not in cached]
+        if not missing:
+            if texts:
+                logger.info(f"Embedding cache: all {len(texts)} texts cached")
+            return np.array([cached[row_hash] for row_hash in hashes], dtype="float32")
+        
+        encoded = self.embedder.encode([texts[i] for i in missing])
+        self.embedding_cache.put_many([hashes[i] for i in missing], encoded)
+        
+        if not cached:
+            return encoded
+        
+        embeddings = np.empty((len(texts), encoded.shape[1]), dtype="float32")
+        embeddings[missing] = encoded
+        for i, row_hash in enumerate(hashes):
+            if row_hash in cached:
+                embeddings[i] = cached[row_hash]
+        
+        logger.info(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} encoded")
+        return embeddings
     
-    def _build_index(self, embeddings: np.ndarray) -> None:
+    def encode_query(self, query: str) -> np.ndarray:
+        """
+        Embed a search query.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Normalized query embedding of shape (1, dim)
+        """
+        normalized = normalize_text(query)
+        cache_key = (EMBED_MODEL_ID, text_hash(normalized))
+        
+        query_emb = query_embedding_cache.get(cache_key)
+        if query_emb is not None:
+            return query_emb
+        
+        query_emb = self.embedder.encode([normalized])
+        
+        # Cached arrays are shared between requests
+        query_emb.setflags(write=False)
+        query_embedding_cache.set(cache_key, query_emb)
+        return query_emb
+    
+    def _build_index(self, embeddings: Optional[np.ndarray]) -> Optional[faiss.Index]:
         """
         Build FAISS index from embeddings.
         
         Args:
             embeddings: Numpy array of embeddings
+            
+        Returns:
+            Populated index, or None for an empty store
+        """
+        if embeddings is None or len(embeddings) == 0:
+            return None
+        
+        embeddings = np.ascontiguousarray(embeddings, dtype="float32")
+        return build_index(self.index_type, embeddings)
+    
+    def _replace_contents(self, rows: RowTable, embeddings: Optional[np.ndarray]) -> None:
         """
-        dim = embeddings.shape[1]
-        self.index = faiss.IndexFlatIP(dim)
-        self.index.add(embeddings)
+        Index new contents off to the side, then publish them at once.
+        
+        Args:
+            rows: New row table
+            embeddings: Embeddings row-aligned with rows
+        """
+        index = self._build_index(embeddings)
+        self._publish(index=index, rows=rows, embeddings=embeddings)
+    
+    def rebuild_index(self) -> None:
+        """
+        Rebuild the FAISS index from the stored embedding matrix.
+        
+        Pure NumPy/FAISS work: no model inference is done.
+        """
+        with self._write_lock:
+            state = self._state
+            self._publish(index=self._build_index(state.embeddings))
+    
+    def index_report(
+        self,
+        index_types: Optional[List[str]] = None,
+        sample_size: int = 200,
+        top_k: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        Measure recall and latency of index types against Flat search.
+        
+        Args:
+            index_types: Index types to evaluate (default: all)
+            sample_size: Number of stored vectors used as queries
+            top_k: Neighbours per query
+            
+        Returns:
+            Recall-vs-latency report
+            
+        Raises:
+            VectorStoreError: If the store is empty
+        """
+        state = self._state
+        if state.embeddings is None or len(state.embeddings) == 0:
+            raise VectorStoreError("Store is empty.")
+        
+        report = benchmark_index_types(state.embeddings, index_types, sample_size, top_k)
+        report["current_index_type"] = index_type_of(state.index)
+        return report
+    
+    def rows_by_hash(self) -> Dict[str, int]:
+        """
+        Map each row's content hash to its row position.
+        
+        Returns:
+            Dict of sha256(text) -> row index
+        """
+        return {row_hash: i for i, row_hash in enumerate(self.row_hashes)}
+    
+    def _stream_build(
+        self,
+        batches: Iterable[RowBatch],
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        """
+        Build, publish, and save the store from row batches.
+        
+        Each batch is embedded (unless it carries embeddings) and appended
+        to an on-disk row table and embedding file, so peak memory does
+        not grow with the corpus. Flat and HNSW indexes take each batch
+        as it arrives; IVF variants are trained on a sample once the row
+        count is known and filled from the memory-mapped embeddings.
+        Caller holds the write lock.
+        
+        Args:
+            batches: Row batches in store order
+            progress: Called after each batch with (rows built, rows/sec)
+            
+        Returns:
+            Number of rows in the built store
+        """
+        build_dir = Path(f"{self.store_dir}.build-{os.getpid()}")
+        shutil.rmtree(build_dir, ignore_errors=True)
+        build_dir.mkdir(parents=True)
+        
+        rows_path = build_dir / self.ROWS_FILE
+        raw_path = build_dir / "embeddings.f32"
+        incremental = not needs_training(self.index_type)
+        progress = progress or self._log_progress
+        
+        previous = self._state
+        index = None
+        dim = None
+        count = 0
+        started = time.perf_counter()
+        
+        try:
+            with RowTableWriter(str(rows_path)) as rows_writer, open(raw_path, "wb") as raw:
+                for texts, metadata, embeddings in batches:
+                    if not texts:
+                        continue
+                    
+                    if embeddings is None:
+                        embeddings = self._add_embeddings(texts)
+                    embeddings = np.ascontiguousarray(embeddings, dtype="float32")
+                    dim = embeddings.shape[1]
+                    
+                    rows_writer.write(texts, metadata)
+                    raw.write(embeddings.tobytes())
+                    
+                    if incremental:
+                        if index is None:
+                            index = create_index(self.index_type, dim, 0)
+                        index.add(embeddings)
+                    
+                    count += len(texts)
+                    elapsed = time.perf_counter() - started
+                    progress(count, count / elapsed if elapsed > 0 else 0.0)
+            
+            if count == 0:
+                self._publish(index=None, rows=RowTable(), embeddings=None)
+            else:
+                embeddings = np.memmap(raw_path, dtype="float32", mode="r", shape=(count, dim))
+                if index is None:
+                    index = self._fill_index(embeddings)
+                configure_search(index)
+                self._publish(index=index, rows=RowTable.open(str(rows_path)), embeddings=embeddings)
+            
+            self.save()
+            self._adopt_snapshot_files()
+        except Exception:
+            # The published state may reference files in build_dir
+            self._state = previous
+            raise
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+        
+        return count
+    
+    def _fill_index(self, embeddings: np.ndarray) -> faiss.Index:
+        """Train an index on a sample of embeddings, then add them in chunks."""
+        count, dim = embeddings.shape
+        sample_size = training_sample_size(self.index_type, count)
+        sample = np.sort(np.random.default_rng(0).choice(count, sample_size, replace=False))
+        
+        index = create_index(self.index_type, dim, count, training=embeddings[sample])
+        for start in range(0, count, BUILD_CHUNK_ROWS):
+            index.add(np.ascontiguousarray(embeddings[start:start + BUILD_CHUNK_ROWS]))
+        return index
+    
+    def _adopt_snapshot_files(self) -> None:
+        """Point the published rows and embeddings at the saved snapshot files."""
+        if self.version is None or not len(self.rows):
+            return
+        
+        directory = self.snapshots.version_dir(self.version)
+        self._publish(
+            rows=RowTable.open(str(directory / self.ROWS_FILE)),
+            embeddings=np.load(directory / self.EMBEDDINGS_FILE, mmap_mode="r"),
+        )
+    
+    @staticmethod
+    def _log_progress(rows: int, rows_per_second: float) -> None:
+        logger.info(f"Built {rows} rows ({rows_per_second:.0f} rows/sec)")
+    
+    def sync_rows(
+        self,
+        texts: List[str],
+        metadata: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """
+        Replace store contents, embedding only new or changed rows.
+        
+        Rows are matched on the SHA-256 of their text; unchanged rows
+        reuse their stored embedding. A row whose text changed but whose
+        key (the metadata values in SYNC_KEY_FIELDS) already existed
+        counts as updated rather than added.
+        
+        Args:
+            texts: Rendered row texts, in the desired store order
+            metadata: Row-aligned metadata dicts
+            
+        Returns:
+            Dict with added, updated, removed, and unchanged counts
+        """
+        with self._writing():
+            return self._sync_rows(texts, metadata)
+    
+    def _sync_rows(
+        self,
+        texts: List[str],
+        metadata: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """Diff and publish synced rows; caller holds the write lock."""
+        state = self._state
+        new_hashes = [text_hash(text) for text in texts]
+        old_hashes = state.rows.hashes()
+        
+        # No-op sync: skip embedding, index build, and disk writes.
+        # Metadata is rendered from the same row as the text, so equal
+        # hashes imply equal metadata.
+        if new_hashes == old_hashes:
+            return {"added": 0, "updated": 0, "removed": 0, "unchanged": len(texts)}
+        
+        def row_key(meta: Dict[str, Any]) -> tuple:
+            return tuple(meta.get(field) for field in self.SYNC_KEY_FIELDS)
+        
+        existing = {row_hash: i for i, row_hash in enumerate(old_hashes)}
+        old_metadata = list(state.rows.metadata)
+        old_keys = {row_key(meta) for meta in old_metadata}
+        new_keys = {row_key(meta) for meta in metadata}
+        new_hash_set = set(new_hashes)
+        
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        missing = []
+        for i, row_hash in enumerate(new_hashes):
+            if row_hash in existing:
+                counts["unchanged"] += 1
+            else:
+                missing.append(i)
+                if row_key(metadata[i]) in old_keys:
+                    counts["updated"] += 1
+                else:
+                    counts["added"] += 1
+        
+        for row_hash, meta in zip(old_hashes, old_metadata):
+            if row_hash not in new_hash_set and row_key(meta) not in new_keys:
+                counts["removed"] += 1
+        
+        new_embeddings = None
+        if missing:
+            new_embeddings = self._add_embeddings([texts[i] for i in missing])
+        
+        if texts:
+            dim = (new_embeddings if new_embeddings is not None else state.embeddings).shape[1]
+            embeddings = np.empty((len(texts), dim), dtype="float32")
+            
+            reused = [i for i, row_hash in enumerate(new_hashes) if row_hash in existing]
+            if reused:
+                embeddings[reused] = state.embeddings[[existing[new_hashes[i]] for i in reused]]
+            if missing:
+                embeddings[missing] = new_embeddings
+        else:
+            embeddings = None
+        
+        self._replace_contents(RowTable.from_rows(texts, metadata, new_hashes), embeddings)
+        self.save()
+        
+        logger.info(
+            f"Synced store: {counts['added']} added, {counts['updated']} updated, "
+            f"{counts['removed']} removed, {counts['unchanged']} unchanged"
+        )
+        return counts
 
 
 class ProjectStoreService(VectorStoreService):
     """Service for managing project vector store."""
     
+    SYNC_KEY_FIELDS = ("project_name",)
+    
     def __init__(self):
         """Initialize project store service."""
-        super().__init__(PROJECTS_INDEX_PATH, PROJECTS_META_PATH)
+        super().__init__(PROJECTS_STORE_DIR, PROJECTS_INDEX_TYPE)
     
-    def build_from_excel(self, excel_path: str) -> int:
+    def build_from_excel(
+        self,
+        excel_path: str,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
         """
         Build vector store from Excel file.
         
+        The workbook's rows replace the store's contents. Sheets are
+        streamed in BUILD_CHUNK_ROWS chunks, so memory stays flat for large
+        workbooks.
+        
         Args:
             excel_path: Path to Excel file
+            progress: Optional callback receiving (rows built, rows/sec)
             
         Returns:
-            Number of projects added
+            Number of projects in the store
         """
-        try:
-            xls = pd.ExcelFile(excel_path)
-            
-            for sheet, category in PROJECT_SHEETS.items():
-                df = xls.parse(sheet)
+        with self._writing():
+            try:
+                count = self._stream_build(self._excel_batches(excel_path), progress)
                 
-                for _, row in df.iterrows():
-                    text = self._row_to_text(row, category)
-                    if not text.strip():
-                        continue
-                    
-                    self.texts.append(text)
-                    self.metadata.append({
-                        "project_name": str(row.get("PROJECT NAME", "")).strip(),
-                        "category": category,
-                        "industry": str(row.get("INDUSTRY", "")).strip(),
-                    })
-            
-            embeddings = self._add_embeddings(self.texts)
-            embeddings = np.array(embeddings).astype("float32")
-            self._build_index(embeddings)
-            self.save()
-            
-            logger.info(f"Built project store with {len(self.texts)} items")
-            return len(self.texts)
+                logger.info(f"Built project store with {count} items")
+                return count
+                
+            except Exception as e:
+                logger.error(f"Failed to build project store from Excel: {str(e)}")
+                raise VectorStoreError(f"Failed to build project store: {str(e)}")
+    
+    def rows_from_excel(self, excel_path: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Render every project sheet of a workbook as texts and metadata for sync_rows.
+        
+        Args:
+            excel_path: Path to Excel file
             
-        except Exception as e:
-            logger.error(f"Failed to build project store from Excel: {str(e)}")
-            raise VectorStoreError(f"Failed to build project store: {str(e)}")
+        Returns:
+            (texts, metadata) in PROJECT_SHEETS order
+        """
+        texts: List[str] = []
+        metadata: List[Dict[str, Any]] = []
+        for batch_texts, batch_metadata, _ in self._excel_batches(excel_path):
+            texts.extend(batch_texts)
+            metadata.extend(batch_metadata)
+        return texts, metadata
+    
+    def _excel_batches(self, excel_path: str) -> Iterator[RowBatch]:
+        """
+        Rendered project rows of every project sheet, chunk by chunk.
+        
+        Sheets are parsed in parallel worker processes and merged in
+        PROJECT_SHEETS order. With EXCEL_PARSE_WORKERS=0 they are instead
+        streamed one at a time, which uses the least memory.
+        """
+        if EXCEL_PARSE_WORKERS <= 0:
+            for sheet, category in PROJECT_SHEETS.items():
+                for df in iter_excel_chunks(excel_path, sheet, BUILD_CHUNK_ROWS):
+                    yield (*self._excel_rows(df, category), None)
+            return
+        
+        sheets = read_sheets_parallel(excel_path, list(PROJECT_SHEETS), EXCEL_PARSE_WORKERS)
+        for sheet, df in sheets:
+            for chunk in iter_dataframe_chunks(df, BUILD_CHUNK_ROWS):
+                yield (*self._excel_rows(chunk, PROJECT_SHEETS[sheet]), None)
+    
+    @staticmethod
+    def _excel_rows(
+        df: pd.DataFrame,
+        category: str,
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Render project workbook rows as texts and metadata, column-wise."""
+        project_name = text_column(df, "PROJECT NAME")
+        industry = text_column(df, "INDUSTRY")
+        
+        texts = (
+            "Project: " + project_name
+            + "\nProject Type: " + text_column(df, "Unnamed: 1")
+            + f"\nCategory: {category}"
+            + "\nIndustry: " + industry
+            + "\nTech Stack: " + text_column(df, "Tech Stack")
+            + "\nDescription: " + text_column(df, "DESCRIPTION")
+        ).str.strip()
+        
+        metadata = [
+            {"project_name": name, "category": category, "industry": ind}
+            for name, ind in zip(project_name.str.strip(), industry.str.strip())
+        ]
+        
+        return texts.tolist(), metadata
     
     def search(self, query: str, top_k: int = DEFAULT_TOP_K_PROJECTS) -> str:
         """
@@ -176,13 +836,30 @@ class ProjectStoreService(VectorStoreService):
         if self.index is None:
             return "No projects found in store."
         
-        query_emb = self.model.encode(
-            [query],
-            normalize_embeddings=True,
-        ).astype("float32")
+        return self.search_by_vector(self.encode_query(query), top_k)
+    
+    def search_by_vector(
+        self,
+        query_emb: np.ndarray,
+        top_k: int = DEFAULT_TOP_K_PROJECTS,
+    ) -> str:
+        """
+        Search for relevant projects with a precomputed query embedding.
         
-        scores, indices = self.index.search(query_emb, top_k)
-        results = [self.texts[i] for i in indices[0]]
+        Args:
+            query_emb: Normalized query embedding of shape (1, dim)
+            top_k: Number of results to return
+            
+        Returns:
+            Formatted project results
+        """
+        state = self._state
+        if state.index is None:
+            return "No projects found in store."
+        
+        scores, indices = state.index.search(query_emb, top_k)
+        texts = state.rows.texts
+        results = [texts[i] for i in indices[0] if i >= 0]
         
         return "\n\n".join(results)
     
@@ -197,80 +874,100 @@ class ProjectStoreService(VectorStoreService):
         Returns:
             List of results with scores and metadata
         """
-        if self.index is None:
+        state = self._state
+        if state.index is None:
             return []
         
-        query_emb = self.model.encode(
-            [query],
-            normalize_embeddings=True,
-        ).astype("float32")
-        
-        scores, indices = self.index.search(query_emb, top_k)
+        query_emb = self.encode_query(query)
+        scores, indices = state.index.search(query_emb, top_k)
         
         results = []
         for score, idx in zip(scores[0], indices[0]):
+            if idx < 0:
+                continue
             results.append({
                 "score": float(score),
-                "text": self.texts[idx],
-                "metadata": self.metadata[idx],
+                "text": state.rows.texts[idx],
+                "metadata": state.rows.metadata[idx],
             })
         
         return results
     
     @staticmethod
-    def _row_to_text(row: pd.Series, category: str) -> str:
-        """Format project row as text."""
-        return f"""
-Project: {row.get('PROJECT NAME', '')}
-Project Type: {row.get('Unnamed: 1', '')}
-Category: {category}
-Industry: {row.get('INDUSTRY', '')}
-Tech Stack: {row.get('Tech Stack', '')}
-Description: {row.get('DESCRIPTION', '')}
-""".strip()
+    def rows_from_sheet(df: pd.DataFrame) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Render Google Sheet project rows as texts and metadata for sync_rows."""
+        project_name = text_column(df, "PROJECT NAME").str.strip()
+        project_type = text_column(df, "").str.strip()
+        project_type = project_type.where(
+            project_type != "",
+            text_column(df, "Unnamed: 1").str.strip(),
+        )
+        industry = text_column(df, "INDUSTRY").str.strip()
+        tech_stack = text_column(df, "Tech Stack").str.strip()
+        description = text_column(df, "DESCRIPTION").str.strip()
+        
+        # Skip empty rows
+        keep = (project_name != "") | (industry != "") | (tech_stack != "") | (description != "")
+        
+        texts = (
+            "Project: " + project_name
+            + "\nProject Type: " + project_type
+            + "\nIndustry: " + industry
+            + "\nTech Stack: " + tech_stack
+            + "\nDescription: " + description
+        ).str.strip()[keep]
+        
+        metadata = [
+            {"project_name": name, "project_type": ptype, "industry": ind}
+            for name, ptype, ind in zip(project_name[keep], project_type[keep], industry[keep])
+        ]
+        
+        return texts.tolist(), metadata
 
 
 class ReviewStoreService(VectorStoreService):
     """Service for managing review vector store."""
     
+    SYNC_KEY_FIELDS = ("product", "country")
+    
     def __init__(self):
         """Initialize review store service."""
-        super().__init__(REVIEWS_INDEX_PATH, REVIEWS_META_PATH)
+        super().__init__(REVIEWS_STORE_DIR, REVIEWS_INDEX_TYPE)
     
-    def build_from_dataframe(self, df: pd.DataFrame) -> int:
+    def build_from_dataframe(
+        self,
+        df: pd.DataFrame,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
         """
         Build vector store from DataFrame.
         
+        The DataFrame's rows replace the store's contents; they are
+        embedded and indexed in BUILD_CHUNK_ROWS chunks.
+        
         Args:
             df: DataFrame with review data
+            progress: Optional callback receiving (rows built, rows/sec)
             
         Returns:
-            Number of reviews added
+            Number of reviews in the store
         """
-        try:
-            for _, row in df.iterrows():
-                text = self._row_to_text(row)
-                if not text.strip():
-                    continue
+        with self._writing():
+            try:
+                count = self._stream_build(
+                    (
+                        (*self.rows_from_dataframe(chunk), None)
+                        for chunk in iter_dataframe_chunks(df, BUILD_CHUNK_ROWS)
+                    ),
+                    progress,
+                )
                 
-                self.texts.append(text)
-                self.metadata.append({
-                    "product": str(row.get("Product Name", "")).strip(),
-                    "rating": row.get("Rating"),
-                    "country": str(row.get("Country", "")).strip(),
-                })
-            
-            embeddings = self._add_embeddings(self.texts)
-            embeddings = np.array(embeddings).astype("float32")
-            self._build_index(embeddings)
-            self.save()
-            
-            logger.info(f"Built review store with {len(self.texts)} items")
-            return len(self.texts)
-            
-        except Exception as e:
-            logger.error(f"Failed to build review store from DataFrame: {str(e)}")
-            raise VectorStoreError(f"Failed to build review store: {str(e)}")
+                logger.info(f"Built review store with {count} items")
+                return count
+                
+            except Exception as e:
+                logger.error(f"Failed to build review store from DataFrame: {str(e)}")
+                raise VectorStoreError(f"Failed to build review store: {str(e)}")
     
     def search(self, query: str, top_k: int = DEFAULT_TOP_K_REVIEWS) -> str:
         """
@@ -286,31 +983,89 @@ class ReviewStoreService(VectorStoreService):
         if self.index is None:
             return "No reviews found in store."
         
-        query_emb = self.model.encode(
-            [query],
-            normalize_embeddings=True,
-        ).astype("float32")
+        return self.search_by_vector(self.encode_query(query), top_k)
+    
+    def search_by_vector(
+        self,
+        query_emb: np.ndarray,
+        top_k: int = DEFAULT_TOP_K_REVIEWS,
+    ) -> str:
+        """
+        Search for relevant reviews with a precomputed query embedding.
+        
+        Args:
+            query_emb: Normalized query embedding of shape (1, dim)
+            top_k: Number of results to return
+            
+        Returns:
+            Formatted review results
+        """
+        state = self._state
+        if state.index is None:
+            return "No reviews found in store."
         
-        scores, indices = self.index.search(query_emb, top_k)
-        return "\n".join(self.texts[i] for i in indices[0])
+        scores, indices = state.index.search(query_emb, top_k)
+        texts = state.rows.texts
+        return "\n".join(texts[i] for i in indices[0] if i >= 0)
     
     @staticmethod
-    def _row_to_text(row: pd.Series) -> str:
-        """Format review row as text."""
-        return f"""
-Review for: {row.get('Product Name', '')}
-Rating: {row.get('Rating')} stars
-Client Location: {row.get('Country', '')}
-Feedback: {row.get('Review / Comment', '')}
-""".strip()
+    def rows_from_dataframe(df: pd.DataFrame) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Render review rows as texts and metadata for sync_rows."""
+        product = text_column(df, "Product Name")
+        country = text_column(df, "Country")
+        rating = df["Rating"].tolist() if "Rating" in df.columns else [None] * len(df)
+        
+        texts = (
+            "Review for: " + product
+            + "\nRating: " + text_column(df, "Rating", default="None") + " stars"
+            + "\nClient Location: " + country
+            + "\nFeedback: " + text_column(df, "Review / Comment")
+        ).str.strip()
+        
+        metadata = [
+            {"product": name, "rating": value, "country": location}
+            for name, value, location in zip(product.str.strip(), rating, country.str.strip())
+        ]
+        
+        return texts.tolist(), metadata
 
 
 class ResumeStoreService(VectorStoreService):
-    """Service for managing resume vector store."""
+    """
+    Service for managing resume vector store.
+    
+    Keeps a case-insensitive name -> row ID index for the published rows.
+    The index is tied to the RowTable it was built from: add_resume
+    extends it, and any other publish (load, sync, delete, rollback)
+    makes it rebuild on the next lookup.
+    """
     
     def __init__(self):
         """Initialize resume store service."""
-        super().__init__(RESUMES_INDEX_PATH, RESUMES_META_PATH)
+        super().__init__(RESUMES_STORE_DIR)
+        # (rows the index describes, lower-cased name -> row IDs)
+        self._names: Tuple[Optional[RowTable], Dict[str, List[int]]] = (None, {})
+    
+    def _name_index(self, rows: RowTable) -> Dict[str, List[int]]:
+        """
+        Get the name index for a RowTable, building it if needed.
+        
+        Args:
+            rows: Rows taken from a single state
+            
+        Returns:
+            Dict of lower-cased name -> row IDs (do not modify)
+        """
+        indexed_rows, names = self._names
+        if indexed_rows is rows:
+            return names
+        
+        names = {}
+        for i, meta in enumerate(rows.metadata):
+            names.setdefault(meta["name"].lower(), []).append(i)
+        
+        self._names = (rows, names)
+        return names
     
     def get_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -322,13 +1077,15 @@ class ResumeStoreService(VectorStoreService):
         Returns:
             Resume data or None
         """
-        for text, meta in zip(self.texts, self.metadata):
-            if meta["name"].lower() == name.lower():
-                return {
-                    "text": text,
-                    "metadata": meta,
-                }
-        return None
+        rows = self.rows
+        row_ids = self._name_index(rows).get(name.lower())
+        if not row_ids:
+            return None
+        
+        return {
+            "text": rows.texts[row_ids[0]],
+            "metadata": rows.metadata[row_ids[0]],
+        }
     
     def add_resume(self, name: str, text: str) -> None:
         """
@@ -342,26 +1099,37 @@ class ResumeStoreService(VectorStoreService):
             ResumeNotFoundError: If resume name already exists
         """
         try:
-            # Prevent duplicate names
-            for meta in self.metadata:
-                if meta["name"].lower() == name.lower():
+            with self._writing():
+                state = self._state
+                
+                # Prevent duplicate names
+                names = self._name_index(state.rows)
+                if name.lower() in names:
                     raise ResumeNotFoundError(
                         f"Resume with name '{name}' already exists."
                     )
-            
-            embedding = self.model.encode(
-                [text],
-                normalize_embeddings=True
-            ).astype("float32")
-            
-            if self.index is None:
-                dim = embedding.shape[1]
-                self.index = faiss.IndexFlatIP(dim)
-            
-            self.index.add(embedding)
-            self.texts.append(text)
-            self.metadata.append({"name": name})
-            self.save()
+                
+                embedding = self._add_embeddings([text])
+                
+                # Add to a copy so in-flight searches keep a stable index
+                if state.index is None:
+                    index = faiss.IndexFlatIP(embedding.shape[1])
+                else:
+                    index = faiss.clone_index(state.index)
+                index.add(embedding)
+                
+                if state.embeddings is None:
+                    embeddings = embedding
+                else:
+                    embeddings = np.vstack([state.embeddings, embedding])
+                
+                rows = state.rows.append(text, {"name": name})
+                
+                # Extend a copy; readers of the old rows keep the old index
+                self._names = (rows, {**names, name.lower(): [len(state.rows)]})
+                
+                self._publish(index=index, rows=rows, embeddings=embeddings)
+                self.save()
             
             logger.info(f"Added resume: {name}")
             
@@ -373,6 +1141,9 @@ class ResumeStoreService(VectorStoreService):
         """
         Delete resume from store.
         
+        Removes the matching vectors from the index by position; the
+        remaining embeddings are kept as-is and never re-encoded.
+        
         Args:
             name: Resume name
             
@@ -380,33 +1151,27 @@ class ResumeStoreService(VectorStoreService):
             True if deleted, False if not found
         """
         try:
-            new_texts = []
-            new_metadata = []
-            
-            for text, meta in zip(self.texts, self.metadata):
-                if meta["name"].lower() != name.lower():
-                    new_texts.append(text)
-                    new_metadata.append(meta)
-            
-            if len(new_texts) == len(self.texts):
-                return False  # Not found
-            
-            self.texts = new_texts
-            self.metadata = new_metadata
-            
-            if not self.texts:
-                self.index = None
-            else:
-                embeddings = self.model.encode(
-                    self.texts,
-                    normalize_embeddings=True
-                ).astype("float32")
+            with self._writing():
+                state = self._state
+                positions = self._name_index(state.rows).get(name.lower(), [])
                 
-                dim = embeddings.shape[1]
-                self.index = faiss.IndexFlatIP(dim)
-                self.index.add(embeddings)
+                if not positions:
+                    return False  # Not found
+                
+                rows = state.rows.delete(positions)
+                if len(rows):
+                    # IndexFlat compacts ids on removal, matching the row
+                    # deletion; remove from a copy so readers are unaffected
+                    index = faiss.clone_index(state.index)
+                    index.remove_ids(np.array(positions, dtype="int64"))
+                    embeddings = np.delete(state.embeddings, positions, axis=0)
+                else:
+                    index = None
+                    embeddings = None
+                
+                self._publish(index=index, rows=rows, embeddings=embeddings)
+                self.save()
             
-            self.save()
             logger.info(f"Deleted resume: {name}")
             return True
             
@@ -428,19 +1193,35 @@ class ResumeStoreService(VectorStoreService):
         if self.index is None:
             raise VectorStoreError("No resumes found in store.")
         
-        query_emb = self.model.encode(
-            [query],
-            normalize_embeddings=True,
-        ).astype("float32")
+        return self.search_by_vector(self.encode_query(query), top_k)
+    
+    def search_by_vector(
+        self,
+        query_emb: np.ndarray,
+        top_k: int = DEFAULT_TOP_K_RESUMES,
+    ) -> Dict[str, Any]:
+        """
+        Search for most similar resume with a precomputed query embedding.
+        
+        Args:
+            query_emb: Normalized query embedding of shape (1, dim)
+            top_k: Number of results (typically 1)
+            
+        Returns:
+            Best matching resume with metadata and score
+        """
+        state = self._state
+        if state.index is None:
+            raise VectorStoreError("No resumes found in store.")
         
-        scores, indices = self.index.search(query_emb, top_k)
+        scores, indices = state.index.search(query_emb, top_k)
         
         idx = indices[0][0]
         score = float(scores[0][0])
         
         return {
-            "text": self.texts[idx],
-            "metadata": self.metadata[idx],
+            "text": state.rows.texts[idx],
+            "metadata": state.rows.metadata[idx],
             "score": score
         }
     
@@ -0,0 +1,131 @@
+# app/utils/extracted_text_cache.py
+"""
+Content-addressed cache of text extracted from uploaded files.
+
+Maps sha256(file bytes) to the extracted text in a SQLite table, tagged
+with the extractor that produced it, so uploading the same resume again
+skips PDF parsing. Embeddings of the text are already cached by text hash
+(see app/services/embedding_cache.py), so a repeat upload to the resume
+store skips the model as well.
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.constants import EXTRACTED_TEXT_CACHE_ENABLED, EXTRACTED_TEXT_CACHE_PATH
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExtractedTextCache:
+    """SQLite table of (file hash, extractor) -> extracted text."""
+
+    def __init__(self, path: str, enabled: bool = True):
+        """
+        Initialize extracted text cache.
+
+        Args:
+            path: SQLite database file
+            enabled: If False, lookups miss and writes are dropped
+        """
+        self.path = path
+        self.enabled = enabled
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, file_hash: str, extractor: str) -> Optional[str]:
+        """
+        Look up the text extracted from a file.
+
+        Args:
+            file_hash: sha256 of the file bytes
+            extractor: Extractor that must have produced the text
+
+        Returns:
+            Extracted text, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT text FROM extracted_text WHERE hash = ? AND extractor = ?",
+                    (file_hash, extractor),
+                ).fetchone()
+                if row is None:
+                    self._misses += 1
+                    return None
+                self._hits += 1
+                return row[0]
+        except sqlite3.Error as e:
+            # The cache is an optimization: fall back to parsing the file
+            logger.warning(f"Extracted text cache lookup failed: {str(e)}")
+            return None
+
+    def put(self, file_hash: str, extractor: str, text: str) -> None:
+        """
+        Store the text extracted from a file.
+
+        Args:
+            file_hash: sha256 of the file bytes
+            extractor: Extractor that produced the text
+            text: Extracted text
+        """
+        if not self.enabled:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO extracted_text (hash, extractor, text) VALUES (?, ?, ?)",
+                        (file_hash, extractor, text),
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Extracted text cache write failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for this process.
+
+        Returns:
+            Dict with hits, misses, and hit rate
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use, and again after a fork."""
+        if self._conn is None or self._pid != os.getpid():
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS extracted_text ("
+                "hash TEXT NOT NULL, extractor TEXT NOT NULL, text TEXT NOT NULL, "
+                "PRIMARY KEY (hash, extractor)) WITHOUT ROWID"
+            )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+
+# Shared by the upload endpoints
+extracted_text_cache = ExtractedTextCache(
+    EXTRACTED_TEXT_CACHE_PATH,
+    enabled=EXTRACTED_TEXT_CACHE_ENABLED,
+)
@@ -2,14 +2,109 @@
 """
 File processing utilities for PDF and text files.
 """
-import pdfplumber
-from typing import Union
+import asyncio
+import hashlib
+from typing import List, Tuple
+
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from app.core.constants import (
+    PDF_EXTRACT_TIMEOUT_SECONDS,
+    PDF_EXTRACTOR,
+    PDF_PAGES_PER_TASK,
+    UPLOAD_MAX_BYTES,
+)
 from app.core.exceptions import FileProcessingError
+from app.core.executors import run_in_process_with_timeout
 from app.core.logging import get_logger
+from app.utils.extracted_text_cache import extracted_text_cache
+from app.utils.pdf_text import extract_pages
 
 logger = get_logger(__name__)
 
+# Extra time a running task gets beyond its page budget (checked between
+# pages) before its worker is killed: covers one stuck page and result transfer
+_PROCESS_GRACE_SECONDS = 5.0
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """
+    Read an upload, rejecting files over UPLOAD_MAX_BYTES.
+    
+    Args:
+        file: UploadFile instance
+        
+    Returns:
+        File contents
+        
+    Raises:
+        FileProcessingError: If the file is too large
+    """
+    content = await file.read(UPLOAD_MAX_BYTES + 1)
+    if len(content) > UPLOAD_MAX_BYTES:
+        raise FileProcessingError(
+            f"File too large (limit {UPLOAD_MAX_BYTES / (1024 * 1024):.1f} MB)."
+        )
+    return content
+
+
+async def _extract_pdf(data: bytes) -> str:
+    """
+    Extract PDF text in the process pool, splitting long documents by page range.
+    
+    The first PDF_PAGES_PER_TASK pages are extracted together with the
+    page count; remaining ranges then run in parallel. Each range gets
+    PDF_EXTRACT_TIMEOUT_SECONDS from when a worker starts it, so waiting
+    behind other uploads does not count.
+    
+    Args:
+        data: PDF file contents
+        
+    Returns:
+        Page texts joined by newlines
+    """
+    texts, page_count, backend = await _extract_range(data, 0, PDF_EXTRACTOR)
+    
+    if page_count > PDF_PAGES_PER_TASK:
+        ranges = await asyncio.gather(*[
+            _extract_range(data, start, backend)
+            for start in range(PDF_PAGES_PER_TASK, page_count, PDF_PAGES_PER_TASK)
+        ])
+        for range_texts, _, _ in ranges:
+            texts.extend(range_texts)
+    
+    logger.info(f"Extracted {page_count} PDF pages with {backend}")
+    return "\n".join(texts)
+
+
+async def _extract_range(data: bytes, start: int, backend: str) -> Tuple[List[str], int, str]:
+    """
+    Extract PDF_PAGES_PER_TASK pages from start in the process pool.
+    
+    The worker stops between pages once PDF_EXTRACT_TIMEOUT_SECONDS have
+    passed; if a single page keeps it busy past the grace period, the
+    process pool is reset.
+    
+    Args:
+        data: PDF file contents
+        start: First page index
+        backend: Preferred backend
+        
+    Returns:
+        (page texts, total page count, backend used)
+        
+    Raises:
+        FileProcessingError: If the range exceeds its time limit
+    """
+    try:
+        return await run_in_process_with_timeout(
+            PDF_EXTRACT_TIMEOUT_SECONDS + _PROCESS_GRACE_SECONDS,
+            extract_pages, data, start, start + PDF_PAGES_PER_TASK,
+            backend, PDF_EXTRACT_TIMEOUT_SECONDS,
+        )
+    except TimeoutError:
+        raise FileProcessingError("PDF text extraction exceeded its time limit.")
+
 
 async def extract_text_from_file(file: UploadFile) -> str:
     """
@@ -21,17 +116,47 @@ async def extract_text_from_file(file: UploadFile) -> str:
     Returns:
         Extracted text content
         
+    Raises:
+        FileProcessingError: If file processing fails
+    """
+    text, _ = await extract_upload_text(file)
+    return text
+
+
+async def extract_upload_text(file: UploadFile) -> Tuple[str, bool]:
+    """
+    Extract text from PDF or TXT file, reusing text from identical uploads.
+    
+    PDFs are looked up by the sha256 of their bytes before parsing; on a
+    miss they are parsed in the process pool so large files do not block
+    the event loop, within UPLOAD_MAX_BYTES and, per page range,
+    PDF_EXTRACT_TIMEOUT_SECONDS.
+    
+    Args:
+        file: UploadFile instance
+        
+    Returns:
+        (extracted text, whether it came from the extracted text cache)
+        
     Raises:
         FileProcessingError: If file processing fails
     """
     try:
+        cache_hit = False
+        
         if file.filename.endswith(".pdf"):
-            with pdfplumber.open(file.file) as pdf:
-                text = "\n".join(
-                    page.extract_text() or "" for page in pdf.pages
-                )
+            content = await _read_upload(file)
+            file_hash = hashlib.sha256(content).hexdigest()
+            
+            # SQLite I/O; keep it off the event loop
+            text = await run_in_threadpool(extracted_text_cache.get, file_hash, PDF_EXTRACTOR)
+            if text is not None:
+                cache_hit = True
+            else:
+                text = await _extract_pdf(content)
+                await run_in_threadpool(extracted_text_cache.put, file_hash, PDF_EXTRACTOR, text)
         elif file.filename.endswith(".txt"):
-            content = await file.read()
+            content = await _read_upload(file)
             text = content.decode("utf-8")
         else:
             raise FileProcessingError(
@@ -39,8 +164,8 @@ async def extract_text_from_file(file: UploadFile) -> str:
                 "Please upload PDF or TXT files only."
             )
         
-        logger.info(f"Successfully extracted text from {file.filename}")
-        return text
+        logger.info(f"Successfully extracted text from {file.filename} (cache_hit={cache_hit})")
+        return text, cache_hit
         
     except Exception as e:
         logger.error(f"Failed to process file {file.filename}: {str(e)}")
@@ -2,15 +2,106 @@
 """
 Google Sheets integration utilities.
 """
+import io
+import os
 import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
 import pandas as pd
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+
+from app.core.constants import (
+    GOOGLE_SHEET_CACHE_SIZE,
+    GOOGLE_SHEET_CSV_ENGINE,
+    GOOGLE_SHEET_TIMEOUT_SECONDS,
+)
 from app.core.exceptions import InvalidGoogleSheetError
 from app.core.logging import get_logger
+from app.utils.cache import LRUTTLCache
 
 logger = get_logger(__name__)
 
+# Bytes read from the response per iteration
+_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class _CachedSheet:
+    """Parsed sheet with the validators needed to revalidate it."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    df: pd.DataFrame
+
+
+# Last parsed DataFrame per CSV URL, revalidated with ETag/Last-Modified.
+# Entries never expire on their own; the server decides via 304.
+_sheet_cache = LRUTTLCache(max_size=GOOGLE_SHEET_CACHE_SIZE, ttl_seconds=float("inf"))
+
+_http: Optional[requests.Session] = None
+_http_pid: Optional[int] = None
+_http_lock = threading.Lock()
+
+
+def _http_session() -> requests.Session:
+    """Pooled HTTP session, created per process (sockets are not fork-safe)."""
+    global _http, _http_pid
+    with _http_lock:
+        if _http is None or _http_pid != os.getpid():
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http = session
+            _http_pid = os.getpid()
+        return _http
+
+
+def _csv_columns(columns: List[str]) -> List[str]:
+    """
+    Name columns the way pandas' default CSV engine does.
+    
+    The pyarrow engine keeps blank and duplicate header cells as is;
+    downstream code expects "Unnamed: <i>" and "<name>.<n>".
+    
+    Args:
+        columns: Header cells as parsed
+        
+    Returns:
+        Column names matching pandas.read_csv(engine="c")
+    """
+    names = []
+    seen: Dict[str, int] = {}
+    for i, column in enumerate(columns):
+        name = str(column) if str(column) != "" else f"Unnamed: {i}"
+        base = name
+        while name in seen:
+            seen[base] += 1
+            name = f"{base}.{seen[base]}"
+        seen.setdefault(base, 0)
+        seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _parse_csv(buffer: io.BytesIO) -> pd.DataFrame:
+    """
+    Parse a downloaded CSV body.
+    
+    Args:
+        buffer: CSV bytes
+        
+    Returns:
+        Parsed DataFrame
+    """
+    if GOOGLE_SHEET_CSV_ENGINE == "pyarrow":
+        df = pd.read_csv(buffer, engine="pyarrow")
+        df.columns = _csv_columns(list(df.columns))
+        return df
+    return pd.read_csv(buffer)
+
 
 def convert_google_sheet_to_csv_url(url: str) -> str:
     """
@@ -49,6 +140,11 @@ def load_google_sheet_dataframe(sheet_url: str) -> pd.DataFrame:
     """
     Load Google Sheet into a pandas DataFrame.
     
+    The CSV is downloaded once over a pooled connection and parsed from
+    memory. Repeat loads send If-None-Match/If-Modified-Since; if the
+    sheet is unchanged (HTTP 304) the previously parsed DataFrame is
+    returned without downloading or parsing again.
+    
     Handles:
     - Private sheets (with appropriate error message)
     - Permission errors
@@ -59,7 +155,7 @@ def load_google_sheet_dataframe(sheet_url: str) -> pd.DataFrame:
         sheet_url: Google Sheets URL
         
     Returns:
-        DataFrame with sheet data
+        DataFrame with sheet data (shared with the cache; do not modify)
         
     Raises:
         InvalidGoogleSheetError: If sheet cannot be accessed or loaded
@@ -68,24 +164,48 @@ def load_google_sheet_dataframe(sheet_url: str) -> pd.DataFrame:
         csv_url = convert_google_sheet_to_csv_url(sheet_url)
         logger.info(f"Loading Google Sheet from CSV URL: {csv_url}")
         
-        response = requests.get(csv_url, timeout=10)
+        cached: Optional[_CachedSheet] = _sheet_cache.get(csv_url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        
+        with _http_session().get(
+            csv_url,
+            headers=headers,
+            timeout=GOOGLE_SHEET_TIMEOUT_SECONDS,
+            stream=True,
+        ) as response:
+            if response.status_code == 304 and cached is not None:
+                logger.info(f"Google Sheet unchanged; reusing DataFrame with shape: {cached.df.shape}")
+                return cached.df
+            
+            if response.status_code != 200:
+                raise InvalidGoogleSheetError(
+                    f"Unable to access sheet (HTTP {response.status_code}). "
+                    "Ensure sharing is set to 'Anyone with link → Viewer'."
+                )
 
-        if response.status_code != 200:
-            raise InvalidGoogleSheetError(
-                f"Unable to access sheet (HTTP {response.status_code}). "
-                "Ensure sharing is set to 'Anyone with link → Viewer'."
-            )
+            content_type = response.headers.get("Content-Type", "")
 
-        content_type = response.headers.get("Content-Type", "")
+            # Google returns text/html if not public
+            if "text/html" in content_type:
+                raise InvalidGoogleSheetError(
+                    "Sheet is not publicly accessible. "
+                    "Set sharing permissions to 'Anyone with link → Viewer'."
+                )
 
-        # Google returns text/html if not public
-        if "text/html" in content_type:
-            raise InvalidGoogleSheetError(
-                "Sheet is not publicly accessible. "
-                "Set sharing permissions to 'Anyone with link → Viewer'."
-            )
+            buffer = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_BYTES):
+                buffer.write(chunk)
+            buffer.seek(0)
+            
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
 
-        df = pd.read_csv(csv_url)
+        df = _parse_csv(buffer)
         logger.info(f"Successfully loaded DataFrame with shape: {df.shape}")
 
         if df.empty:
@@ -93,13 +213,16 @@ def load_google_sheet_dataframe(sheet_url: str) -> pd.DataFrame:
                 "Sheet loaded but contains no data. "
                 "Please check the sheet content."
             )
+        
+        if etag or last_modified:
+            _sheet_cache.set(csv_url, _CachedSheet(etag, last_modified, df))
 
         return df
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Network error accessing Google Sheet: {str(e)}")
         raise InvalidGoogleSheetError(f"Network error: {str(e)}")
-    except pd.errors.ParserError as e:
+    except (pd.errors.ParserError, ValueError) as e:
         logger.error(f"Failed to parse CSV: {str(e)}")
         raise InvalidGoogleSheetError(
             "Failed to parse CSV. Ensure sheet contains valid tabular data."
@@ -0,0 +1,31 @@
+# app/utils/hashing.py
+"""
+Content hashing utilities.
+"""
+import hashlib
+
+
+def normalize_text(text: str) -> str:
+    """
+    Collapse whitespace so trivially different pastes hash the same.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Text with runs of whitespace collapsed to single spaces
+    """
+    return " ".join(text.split())
+
+
+def text_hash(text: str) -> str:
+    """
+    Hash text content.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Hex SHA-256 digest of the UTF-8 encoded text
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
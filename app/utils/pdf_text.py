@@ -0,0 +1,117 @@
+# app/utils/pdf_text.py
+"""
+PDF text extraction.
+
+Functions here are module-level and import nothing heavy at module scope,
+so they can run in spawned worker processes. pypdfium2 is used when
+available; pdfplumber is the fallback for environments without it and for
+files pdfium cannot open.
+"""
+import io
+import time
+from typing import List, Optional, Tuple
+
+from app.core.exceptions import FileProcessingError
+
+PDF_BACKENDS = ("pypdfium2", "pdfplumber")
+
+
+def _pdfium_pages(data: bytes, start: int, stop: Optional[int], deadline: float) -> Tuple[List[str], int]:
+    """Extract pages [start, stop) with pypdfium2; returns (texts, page count)."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(data)
+    try:
+        page_count = len(pdf)
+        texts = []
+        for i in range(start, page_count if stop is None else min(stop, page_count)):
+            _check_deadline(deadline)
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                texts.append(textpage.get_text_range().replace("\r\n", "\n").replace("\r", "\n"))
+            finally:
+                textpage.close()
+                page.close()
+        return texts, page_count
+    finally:
+        pdf.close()
+
+
+def _pdfplumber_pages(data: bytes, start: int, stop: Optional[int], deadline: float) -> Tuple[List[str], int]:
+    """Extract pages [start, stop) with pdfplumber; returns (texts, page count)."""
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        page_count = len(pdf.pages)
+        texts = []
+        for page in pdf.pages[start:stop]:
+            _check_deadline(deadline)
+            texts.append(page.extract_text() or "")
+            # Parsed layout objects are cached per page; free them as we go
+            page.close()
+        return texts, page_count
+
+
+def _check_deadline(deadline: float) -> None:
+    """Abort between pages once the time budget is spent."""
+    if time.monotonic() > deadline:
+        raise FileProcessingError("PDF text extraction exceeded its time limit.")
+
+
+def extract_pages(
+    data: bytes,
+    start: int = 0,
+    stop: Optional[int] = None,
+    backend: str = "pypdfium2",
+    timeout_seconds: float = 30.0,
+) -> Tuple[List[str], int, str]:
+    """
+    Extract text from a range of PDF pages.
+
+    Falls back to pdfplumber if pypdfium2 is not installed or cannot
+    open the document.
+
+    Args:
+        data: PDF file contents
+        start: First page index
+        stop: Page index to stop before (None for the last page)
+        backend: Preferred backend (see PDF_BACKENDS)
+        timeout_seconds: Time budget, checked between pages
+
+    Returns:
+        (page texts, total page count, backend used)
+
+    Raises:
+        FileProcessingError: If the time budget is exceeded
+    """
+    deadline = time.monotonic() + timeout_seconds
+
+    if backend == "pypdfium2":
+        try:
+            texts, page_count = _pdfium_pages(data, start, stop, deadline)
+            return texts, page_count, "pypdfium2"
+        except FileProcessingError:
+            raise
+        except Exception:
+            # ImportError or a document pdfium rejects
+            pass
+
+    texts, page_count = _pdfplumber_pages(data, start, stop, deadline)
+    return texts, page_count, "pdfplumber"
+
+
+def extract_pdf_text(data: bytes, backend: str = "pypdfium2", timeout_seconds: float = 30.0) -> str:
+    """
+    Extract text from a whole PDF in the calling process.
+
+    Args:
+        data: PDF file contents
+        backend: Preferred backend (see PDF_BACKENDS)
+        timeout_seconds: Time budget, checked between pages
+
+    Returns:
+        Page texts joined by newlines
+    """
+    texts, _, _ = extract_pages(data, backend=backend, timeout_seconds=timeout_seconds)
+    return "\n".join(texts)
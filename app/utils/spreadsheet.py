@@ -0,0 +1,176 @@
+# app/utils/spreadsheet.py
+"""
+Spreadsheet reading for large builds: chunked streaming of one sheet, or
+parallel parsing of several sheets across a process pool.
+"""
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _header(values: tuple) -> List[str]:
+    """Column names, matching pandas.read_excel for blank header cells."""
+    return [
+        f"Unnamed: {i}" if value is None else str(value)
+        for i, value in enumerate(values)
+    ]
+
+
+def _frame(rows: List[tuple], columns: List[str]) -> pd.DataFrame:
+    """Build a chunk DataFrame typed like pandas.read_excel would type it."""
+    df = pd.DataFrame(rows, columns=columns)
+    return df.replace({None: np.nan}).infer_objects()
+
+
+def text_column(df: pd.DataFrame, column: str, default: str = "") -> pd.Series:
+    """
+    Render a column as strings for column-wise text building.
+
+    Values are formatted with str(), as an f-string would format them
+    (NaN becomes "nan").
+
+    Args:
+        df: Source DataFrame
+        column: Column name
+        default: Value for every row if the column is missing
+
+    Returns:
+        String Series aligned with df
+    """
+    if column in df.columns:
+        return df[column].map(str).astype(object)
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def iter_excel_chunks(
+    path: str,
+    sheet_name: str,
+    chunk_rows: int,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a worksheet as DataFrames of at most chunk_rows rows.
+
+    Uses openpyxl's read-only mode for .xlsx/.xlsm, so only the current
+    chunk is held in memory. Other formats are read whole by pandas and
+    then chunked. The first row is the header.
+
+    Args:
+        path: Path to .xlsx file
+        sheet_name: Worksheet name
+        chunk_rows: Maximum rows per chunk
+
+    Yields:
+        DataFrame chunks in sheet order
+    """
+    if not str(path).lower().endswith((".xlsx", ".xlsm")):
+        yield from iter_dataframe_chunks(pd.read_excel(path, sheet_name=sheet_name), chunk_rows)
+        return
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        columns: Optional[List[str]] = None
+        chunk: List[tuple] = []
+
+        for values in rows:
+            if columns is None:
+                columns = _header(values)
+                continue
+
+            chunk.append(values[:len(columns)])
+            if len(chunk) >= chunk_rows:
+                yield _frame(chunk, columns)
+                chunk = []
+
+        if chunk:
+            yield _frame(chunk, columns)
+    finally:
+        workbook.close()
+
+
+def iter_dataframe_chunks(df: pd.DataFrame, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Split a DataFrame into consecutive chunks of at most chunk_rows rows.
+
+    Args:
+        df: Source DataFrame
+        chunk_rows: Maximum rows per chunk
+
+    Yields:
+        DataFrame views in row order
+    """
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def excel_engine() -> Optional[str]:
+    """
+    Fastest available pandas Excel engine.
+
+    Returns:
+        "calamine" if python-calamine is installed, else None (pandas default)
+    """
+    if importlib.util.find_spec("python_calamine") is not None:
+        return "calamine"
+    return None
+
+
+def read_sheet(path: str, sheet_name: str, engine: Optional[str] = None) -> pd.DataFrame:
+    """
+    Parse one worksheet.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        path: Path to workbook
+        sheet_name: Worksheet name
+        engine: pandas Excel engine (None for the default)
+
+    Returns:
+        Parsed DataFrame
+    """
+    return pd.read_excel(path, sheet_name=sheet_name, engine=engine)
+
+
+def read_sheets_parallel(
+    path: str,
+    sheet_names: Sequence[str],
+    workers: int,
+) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Parse worksheets in a process pool, yielding them in the given order.
+
+    Results are yielded in sheet_names order regardless of which worker
+    finishes first, so downstream row order is reproducible.
+
+    Args:
+        path: Path to workbook
+        sheet_names: Worksheets to parse
+        workers: Maximum worker processes (1 parses in-process)
+
+    Yields:
+        (sheet name, DataFrame) pairs
+    """
+    engine = excel_engine()
+    workers = min(workers, len(sheet_names))
+
+    if workers <= 1:
+        for sheet_name in sheet_names:
+            yield sheet_name, read_sheet(path, sheet_name, engine)
+        return
+
+    # spawn: the parent runs model and watcher threads that fork would copy
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(read_sheet, path, sheet_name, engine)
+            for sheet_name in sheet_names
+        ]
+        for sheet_name, future in zip(sheet_names, futures):
+            yield sheet_name, future.result()
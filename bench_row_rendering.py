@@ -0,0 +1,183 @@
+"""
+Micro-benchmark: column-wise row rendering vs the previous iterrows loops.
+
+Renders a synthetic sheet with the vectorized store helpers and with the
+original per-row implementations (kept here as the reference), checks
+that both produce identical texts and metadata, and prints timings.
+
+Usage:
+    python bench_row_rendering.py --rows 100000
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.services.vectorstore_service import ProjectStoreService, ReviewStoreService
+
+
+# ---------------------------------------------------------------------------
+# Reference implementations (per-row, as before)
+# ---------------------------------------------------------------------------
+
+def project_row_to_text(row, category):
+    return f"""
+Project: {row.get('PROJECT NAME', '')}
+Project Type: {row.get('Unnamed: 1', '')}
+Category: {category}
+Industry: {row.get('INDUSTRY', '')}
+Tech Stack: {row.get('Tech Stack', '')}
+Description: {row.get('DESCRIPTION', '')}
+""".strip()
+
+
+def excel_rows_iterrows(df, category):
+    texts, metadata = [], []
+    for _, row in df.iterrows():
+        text = project_row_to_text(row, category)
+        if not text.strip():
+            continue
+        texts.append(text)
+        metadata.append({
+            "project_name": str(row.get("PROJECT NAME", "")).strip(),
+            "category": category,
+            "industry": str(row.get("INDUSTRY", "")).strip(),
+        })
+    return texts, metadata
+
+
+def sheet_rows_iterrows(df):
+    texts, metadata = [], []
+    for _, row in df.iterrows():
+        project_name = str(row.get("PROJECT NAME", "")).strip()
+        project_type = str(row.get("", "")).strip()
+        if not project_type:
+            project_type = str(row.get("Unnamed: 1", "")).strip()
+        industry = str(row.get("INDUSTRY", "")).strip()
+        tech_stack = str(row.get("Tech Stack", "")).strip()
+        description = str(row.get("DESCRIPTION", "")).strip()
+        if not (project_name or industry or tech_stack or description):
+            continue
+        texts.append(f"""
+Project: {project_name}
+Project Type: {project_type}
+Industry: {industry}
+Tech Stack: {tech_stack}
+Description: {description}
+""".strip())
+        metadata.append({
+            "project_name": project_name,
+            "project_type": project_type,
+            "industry": industry,
+        })
+    return texts, metadata
+
+
+def review_rows_iterrows(df):
+    texts, metadata = [], []
+    for _, row in df.iterrows():
+        text = f"""
+Review for: {row.get('Product Name', '')}
+Rating: {row.get('Rating')} stars
+Client Location: {row.get('Country', '')}
+Feedback: {row.get('Review / Comment', '')}
+""".strip()
+        if not text.strip():
+            continue
+        texts.append(text)
+        metadata.append({
+            "product": str(row.get("Product Name", "")).strip(),
+            "rating": row.get("Rating"),
+            "country": str(row.get("Country", "")).strip(),
+        })
+    return texts, metadata
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+def make_frames(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+
+    def words(prefix, blank_rate=0.1):
+        values = np.array([f"{prefix} {i} " for i in rng.integers(0, 1000, n)], dtype=object)
+        values[rng.random(n) < blank_rate] = np.nan
+        return values
+
+    projects = pd.DataFrame({
+        "PROJECT NAME": words("Project"),
+        "": words("Web", blank_rate=0.5),
+        "Unnamed: 1": words("Mobile"),
+        "INDUSTRY": words("Industry"),
+        "Tech Stack": words("Python, Flutter"),
+        "DESCRIPTION": words("Description\nwith lines"),
+    })
+    reviews = pd.DataFrame({
+        "Product Name": words("Product"),
+        "Rating": rng.integers(1, 6, n).astype(float),
+        "Country": words("Country"),
+        "Review / Comment": words("Great work"),
+    })
+    reviews.loc[reviews.index[::7], "Rating"] = np.nan
+    return projects, reviews
+
+
+def same(a, b) -> bool:
+    # NaN != NaN, so compare metadata through repr
+    return a[0] == b[0] and repr(a[1]) == repr(b[1])
+
+
+def bench(name, reference, vectorized, repeats):
+    timings = []
+    for fn in (reference, vectorized):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            result = fn()
+        timings.append((time.perf_counter() - start) / repeats)
+    ok = same(reference(), vectorized())
+    print(
+        f"{name:<14} iterrows {timings[0] * 1000:9.1f} ms   "
+        f"vectorized {timings[1] * 1000:8.1f} ms   "
+        f"{timings[0] / timings[1]:6.1f}x   {'OK' if ok else 'MISMATCH'}"
+    )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    projects, reviews = make_frames(args.rows)
+    print(f"Rows: {args.rows}")
+
+    results = [
+        bench(
+            "excel rows",
+            lambda: excel_rows_iterrows(projects, "Python Project"),
+            lambda: ProjectStoreService._excel_rows(projects, "Python Project"),
+            args.repeats,
+        ),
+        bench(
+            "sheet rows",
+            lambda: sheet_rows_iterrows(projects),
+            lambda: ProjectStoreService.rows_from_sheet(projects),
+            args.repeats,
+        ),
+        bench(
+            "review rows",
+            lambda: review_rows_iterrows(reviews),
+            lambda: ReviewStoreService.rows_from_dataframe(reviews),
+            args.repeats,
+        ),
+    ]
+
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
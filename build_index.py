@@ -1,9 +1,27 @@
-from app.resume_store import FaissResumeStore
-from app.review_store import FaissReviewStore
-from app.vectorstore import FaissProjectStore
+from pathlib import Path
+
+import pandas as pd
+
+from app.services.vectorstore_service import (
+    ProjectStoreService,
+    ReviewStoreService,
+    ResumeStoreService,
+)
+from app.utils.pdf_text import extract_pdf_text
 
 RESUME_FOLDER = "resume"
 EXCEL_FILE = "evenmore own portfolio.xlsx"
+REVIEWS_SHEET = "REVIEWS"
+
+# Every store is synced against its published snapshot: rows are matched
+# by content hash, so only new or changed rows are embedded, and a re-run
+# over unchanged inputs publishes nothing.
+
+
+def read_resume(path: Path) -> str:
+    if path.suffix.lower() == ".pdf":
+        return extract_pdf_text(path.read_bytes())
+    return path.read_text(encoding="utf-8")
 
 
 def build_all():
@@ -11,21 +29,30 @@ def build_all():
 
     # Resume index
     print("📄 Building Resume Index...")
-    resume_store = FaissResumeStore()
-    resume_store.build_from_folder()
-    print("✅ Resume index built.\n")
+    resume_store = ResumeStoreService()
+    files = sorted(
+        p for p in Path(RESUME_FOLDER).iterdir()
+        if p.suffix.lower() in (".pdf", ".txt")
+    )
+    resume_store.sync_rows(
+        [read_resume(p) for p in files],
+        [{"name": p.stem} for p in files],
+    )
+    print(f"✅ Resume index built ({len(files)} resumes).\n")
 
     # Review index
     print("⭐ Building Review Index...")
-    review_store = FaissReviewStore()
-    review_store.build_from_excel(EXCEL_FILE)
-    print("✅ Review index built.\n")
+    review_store = ReviewStoreService()
+    counts = review_store.sync_rows(
+        *review_store.rows_from_dataframe(pd.read_excel(EXCEL_FILE, sheet_name=REVIEWS_SHEET))
+    )
+    print(f"✅ Review index built ({counts}).\n")
 
     # Project index
     print("📦 Building Project Index...")
-    project_store = FaissProjectStore()
-    project_store.build_from_excel(EXCEL_FILE)
-    print("✅ Project index built.\n")
+    project_store = ProjectStoreService()
+    counts = project_store.sync_rows(*project_store.rows_from_excel(EXCEL_FILE))
+    print(f"✅ Project index built ({counts}).\n")
 
     print("🎉 All indexes built successfully!")
 
@@ -0,0 +1,79 @@
+"""
+Check that an ONNX embedding backend matches the PyTorch vectors.
+
+Encodes a small job/project corpus with the torch backend and the backend
+under test, then reports per-text cosine similarity and encode latency.
+Exits non-zero if any cosine falls below the threshold.
+
+Usage:
+    python check_embedding_parity.py --backend onnx-int8 --threshold 0.98
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from app.core.constants import EMBED_MODEL, EMBED_ONNX_DIR, EMBED_ONNX_QUANTIZATION
+from app.core.embedding_backends import EMBED_BACKENDS, load_embedding_model
+
+SAMPLE_TEXTS = [
+    "Looking for a Flutter developer to build a food delivery app with Firebase.",
+    "Need a Python Django expert for a vendor management and GST invoicing system.",
+    "Laravel developer wanted to maintain a social media scheduling platform.",
+    "Build a React dashboard with charts for supply chain analytics.",
+    "Senior full stack engineer: Java, SQL, JavaScript, 0-4 years experience.",
+    "Project: Place Finder\nTech Stack: Flutter, Firebase\nDescription: Locate places with maps and filters.",
+    "Review for: Aqua Flow\nRating: 5 stars\nClient Location: India\nFeedback: Delivered on time.",
+    "Machine learning engineer to fine-tune a text classifier and deploy it on AWS.",
+    "Fix bugs in an existing PHP e-commerce site and add a payment gateway.",
+    "We need a mobile app MVP in two weeks, budget is fixed.",
+]
+
+
+def time_encode(model, texts, repeats: int) -> float:
+    """Mean seconds per encode call over repeats."""
+    model.encode(texts, normalize_embeddings=True)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        model.encode(texts, normalize_embeddings=True)
+    return (time.perf_counter() - start) / repeats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", default="onnx-int8", choices=[b for b in EMBED_BACKENDS if b != "torch"])
+    parser.add_argument("--threshold", type=float, default=0.98, help="Minimum cosine similarity")
+    parser.add_argument("--quantization", default=EMBED_ONNX_QUANTIZATION)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    reference = load_embedding_model(EMBED_MODEL, "torch", EMBED_ONNX_DIR)
+    candidate = load_embedding_model(EMBED_MODEL, args.backend, EMBED_ONNX_DIR, args.quantization)
+
+    expected = reference.encode(SAMPLE_TEXTS, normalize_embeddings=True)
+    actual = candidate.encode(SAMPLE_TEXTS, normalize_embeddings=True)
+
+    # Both are L2-normalized, so the row-wise dot product is the cosine
+    cosines = np.sum(expected * actual, axis=1)
+    print(f"Backend: {args.backend}")
+    print(f"Cosine vs torch: min={cosines.min():.5f} mean={cosines.mean():.5f}")
+
+    for batch in (SAMPLE_TEXTS[:1], SAMPLE_TEXTS):
+        torch_s = time_encode(reference, batch, args.repeats)
+        candidate_s = time_encode(candidate, batch, args.repeats)
+        print(
+            f"Batch {len(batch):>2}: torch {torch_s * 1000:.2f} ms, "
+            f"{args.backend} {candidate_s * 1000:.2f} ms ({torch_s / candidate_s:.2f}x)"
+        )
+
+    if cosines.min() < args.threshold:
+        print(f"FAIL: cosine {cosines.min():.5f} below threshold {args.threshold}")
+        return 1
+
+    print("PASS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Check that rebuilding the project and review stores from unchanged input keeps their size.
+
+Builds each store several times from the same DataFrame / workbook, each
+time with a fresh service instance (as a new process would be), inside a
+temporary working directory so the real data/ stores are not touched.
+Exits non-zero if the row count changes between builds.
+
+Usage:
+    python check_rebuild_idempotent.py --runs 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from app.core.constants import PROJECT_SHEETS
+from app.services.vectorstore_service import ProjectStoreService, ReviewStoreService
+
+REVIEWS = pd.DataFrame({
+    "Product Name": ["Aqua Flow", "Place Finder"],
+    "Rating": [5, 4],
+    "Country": ["India", "USA"],
+    "Review / Comment": ["Delivered on time.", "Great communication."],
+})
+
+PROJECTS = pd.DataFrame({
+    "PROJECT NAME": ["Place Finder", "Vendor Portal"],
+    "INDUSTRY": ["Travel", "Retail"],
+    "Tech Stack": ["Flutter, Firebase", "Django, PostgreSQL"],
+    "DESCRIPTION": ["Locate places with maps.", "GST invoicing for vendors."],
+})
+
+
+def build_counts(build, runs: int) -> list:
+    """Row counts after each of runs builds."""
+    return [build() for _ in range(runs)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    # Store paths are relative to the working directory
+    os.chdir(tempfile.mkdtemp(prefix="rebuild-check-"))
+
+    workbook = "projects.xlsx"
+    with pd.ExcelWriter(workbook) as writer:
+        for sheet in PROJECT_SHEETS:
+            PROJECTS.to_excel(writer, sheet_name=sheet, index=False)
+
+    results = {
+        "reviews": build_counts(lambda: ReviewStoreService().build_from_dataframe(REVIEWS), args.runs),
+        "projects": build_counts(lambda: ProjectStoreService().build_from_excel(workbook), args.runs),
+    }
+
+    failed = False
+    for store, counts in results.items():
+        print(f"{store}: rows after each build {counts}")
+        if len(set(counts)) != 1:
+            print(f"FAIL: rebuilding {store} from unchanged input changed its size")
+            failed = True
+
+    if failed:
+        return 1
+
+    print("PASS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
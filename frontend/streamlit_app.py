@@ -1,3 +1,5 @@
+import json
+
 import streamlit as st
 import requests
 
@@ -9,8 +11,10 @@ API_BASE = "http://127.0.0.1:8000/api/v1"
 
 CLASSIFY_URL = f"{API_BASE}/classify"
 GENERATE_URL = f"{API_BASE}/generate/upwork"
+GENERATE_STREAM_URL = f"{API_BASE}/generate/upwork/stream"
 GENERATE_UPLOAD_URL = f"{API_BASE}/generate/upwork/upload"
 FOLLOWUP_URL = f"{API_BASE}/generate/upwork/followup"
+FOLLOWUP_STREAM_URL = f"{API_BASE}/generate/upwork/followup/stream"
 RESUME_URL = f"{API_BASE}/resumes"
 SESSIONS_URL = f"{API_BASE}/sessions"
 UPLOAD_RESUME_URL = f"{API_BASE}/resumes/upload"
@@ -104,6 +108,24 @@ def fetch_single_session(session_id):
         pass
     return None
 
+def is_event_stream(response):
+    return response.headers.get("content-type", "").startswith("text/event-stream")
+
+def stream_tokens(response, result):
+    """Yield token text from an SSE response; the final payload goes into result."""
+    event = None
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: "):
+            data = json.loads(line[len("data: "):])
+            if event == "token":
+                yield data["text"]
+            elif event == "done":
+                result.update(data)
+            elif event == "error":
+                result["error"] = data["detail"]
+
 # ==============================
 # ⚙️ Sidebar
 # ==============================
@@ -365,21 +387,23 @@ if user_input:
     if st.session_state.session_id:
         with st.spinner("Thinking..."):
             r = requests.post(
-                FOLLOWUP_URL,
+                FOLLOWUP_STREAM_URL,
                 json={
                     "session_id": st.session_state.session_id,
                     "question": user_input
-                }
+                },
+                stream=True,
+                timeout=120
             )
 
         if r.status_code == 200:
-            data = r.json()
-            content = data.get("answer") or data.get("proposal")
+            result = {}
+            with st.chat_message("assistant"):
+                content = st.write_stream(stream_tokens(r, result))
 
-            if content:
-                with st.chat_message("assistant"):
-                    st.markdown(content)
-            else:
+            if "error" in result:
+                st.error(result["error"])
+            elif not content:
                 st.error("Empty response from backend.")
         else:
             st.error(r.text)
@@ -401,9 +425,9 @@ if user_input:
                     )
                 st.stop()
 
-        with st.spinner("Generating proposal..."):
+        try:
 
-            try:
+            with st.spinner("Generating proposal..."):
 
                 if st.session_state.resume_mode == "upload":
 
@@ -431,32 +455,47 @@ if user_input:
                         "requirement": user_input,
                         "resume_name": st.session_state.selected_resume
                     }
-                    r = requests.post(GENERATE_URL, json=payload)
+                    r = requests.post(GENERATE_STREAM_URL, json=payload, stream=True, timeout=120)
 
                 else:
                     r = requests.post(
-                        GENERATE_URL,
-                        json={"requirement": user_input}
+                        GENERATE_STREAM_URL,
+                        json={"requirement": user_input},
+                        stream=True,
+                        timeout=120
                     )
 
-                if r.status_code == 200:
-                    data = r.json()
+            if r.status_code == 200 and is_event_stream(r):
+                result = {}
+                with st.chat_message("assistant"):
+                    st.write_stream(stream_tokens(r, result))
 
-                    if "best_match_resume" in data:
-                        st.session_state.resume_mismatch = {
-                            "message": data["error"],
-                            "best_match": data["best_match_resume"],
-                            "score": data["similarity_score"],
-                            "requirement": user_input
-                        }
-                        st.rerun()
+                if "error" in result:
+                    st.error(result["error"])
+                    st.stop()
 
-                    st.session_state.session_id = data["session_id"]
-                    fetch_sessions.clear()
+                st.session_state.session_id = result["session_id"]
+                fetch_sessions.clear()
+                st.rerun()
+
+            elif r.status_code == 200:
+                data = r.json()
+
+                if "best_match_resume" in data:
+                    st.session_state.resume_mismatch = {
+                        "message": data["error"],
+                        "best_match": data["best_match_resume"],
+                        "score": data["similarity_score"],
+                        "requirement": user_input
+                    }
                     st.rerun()
 
-                else:
-                    st.error(r.text)
+                st.session_state.session_id = data["session_id"]
+                fetch_sessions.clear()
+                st.rerun()
+
+            else:
+                st.error(r.text)
 
-            except Exception as e:
-                st.error(str(e))
\ No newline at end of file
+        except Exception as e:
+            st.error(str(e))